@@ -972,14 +972,18 @@ def extract_skills_for_jobs(text: str, max_skills: int = 20) -> List[str]:
     if not text:
         return []
     text_lower = text.lower()
-    matches = set()
+    # Ordered dict dedup keeps output deterministic (library order) and lets
+    # us stop scanning as soon as the cap is reached
+    found = {}
     for skill in COMPREHENSIVE_SKILL_LIBRARY:
         pattern = r'\b' + re.escape(skill.lower()) + r'\b'
         if re.search(pattern, text_lower):
             if skill == "Go" and not _is_go_language_context(text_lower):
                 continue
-            matches.add(skill)
-    return sorted(matches)[:max_skills]
+            found[skill] = None
+            if len(found) >= max_skills:
+                break
+    return list(found)
 
 
 def _extract_skills_list(resume_data: Dict) -> List[str]:
@@ -1132,6 +1136,7 @@ def safe_context_extraction(text: str) -> Dict:
 
         # Ensure the results have all required keys
         safe_results = {
+            "doc": results.get("doc"),
             "entities": results.get("entities", []),
             "sections": results.get("sections", {}),
             "section_analysis": results.get("section_analysis", {
@@ -2798,13 +2803,15 @@ def _perform_standard_analysis(text: str) -> Dict:
     """Standard analysis with structured data but limited intelligence"""
     try:
         context_results = safe_context_extraction(text)
+        # The parsed Doc is reused below, not returned to the client
+        doc = context_results.pop("doc", None)
 
         # Add basic relationship extraction if available
         if INTELLIGENT_MODULES_AVAILABLE:
             try:
                 from relationship_extractor import IntelligentRelationshipExtractor
                 rel_extractor = IntelligentRelationshipExtractor(nlp)
-                relationship_results = rel_extractor.extract_relationships(text, context_results["entities"])
+                relationship_results = rel_extractor.extract_relationships(text, context_results["entities"], doc=doc)
 
                 # Ensure experience_metrics has average_tenure
                 if "experience_metrics" in relationship_results:
@@ -13,6 +13,31 @@ load_dotenv()
 logger = logging.getLogger(__name__)
 
 
+def _safe_parse_array(data, default=None):
+    """Safely parse data into a list, handling strings, JSON strings, and lists"""
+    if data is None:
+        return default if default is not None else []
+    if isinstance(data, list):
+        return data
+    if isinstance(data, str):
+        try:
+            # Try to parse as JSON array
+            parsed = json.loads(data)
+            if isinstance(parsed, list):
+                return parsed
+            else:
+                # If it's a single value in JSON, wrap in array
+                return [parsed]
+        except (json.JSONDecodeError, TypeError):
+            # If it's a plain string, treat as single-item array
+            return [data]
+    # For any other type, try to convert to list
+    try:
+        return list(data)
+    except (TypeError, ValueError):
+        return [str(data)]
+
+
 class DatabaseConnection:
     """
     Database connection class with vector support for job matching system
@@ -77,9 +102,12 @@ class DatabaseConnection:
         if not db_vector:
             return np.array([])
 
-        # Remove brackets and convert to numpy array
+        # numpy parses the split values in C instead of a Python
+        # float() call per element
         vector_str = db_vector.strip('[]')
-        return np.array([float(x) for x in vector_str.split(',')])
+        if not vector_str:
+            return np.array([])
+        return np.array(vector_str.split(','), dtype=np.float64)
 
     # Resume operations
 
@@ -277,35 +305,10 @@ class DatabaseConnection:
             requirements_embedding = self.vector_to_db(embeddings.get('requirements', np.array([])))
             title_embedding = self.vector_to_db(embeddings.get('title', np.array([])))
 
-            # Ensure arrays are properly formatted
-            def safe_parse_array(data, default=[]):
-                """Safely parse data into a list, handling strings, JSON strings, and lists"""
-                if data is None:
-                    return default
-                if isinstance(data, list):
-                    return data
-                if isinstance(data, str):
-                    try:
-                        # Try to parse as JSON array
-                        parsed = json.loads(data)
-                        if isinstance(parsed, list):
-                            return parsed
-                        else:
-                            # If it's a single value in JSON, wrap in array
-                            return [parsed]
-                    except (json.JSONDecodeError, TypeError):
-                        # If it's a plain string, treat as single-item array
-                        return [data]
-                # For any other type, try to convert to list
-                try:
-                    return list(data)
-                except (TypeError, ValueError):
-                    return [str(data)]
-
             # Apply safe parsing to all array fields
-            benefits = safe_parse_array(job_data.get('benefits', []))
-            skills_required = safe_parse_array(job_data.get('skills_required', []))
-            skills_preferred = safe_parse_array(job_data.get('skills_preferred', []))
+            benefits = _safe_parse_array(job_data.get('benefits', []))
+            skills_required = _safe_parse_array(job_data.get('skills_required', []))
+            skills_preferred = _safe_parse_array(job_data.get('skills_preferred', []))
 
             query = """
                     INSERT INTO jobs (title, company, description, requirements, responsibilities, \
@@ -347,6 +350,69 @@ class DatabaseConnection:
             logger.error(f" Job data: {job_data}")
             raise
 
+    def store_job_postings_bulk(self, jobs: List[Dict],
+                                embeddings_list: List[Dict[str, np.ndarray]]) -> List[int]:
+        """
+        Store multiple job postings in a single batched insert
+
+        Args:
+            jobs: List of job data dicts (same shape as store_job_posting)
+            embeddings_list: Parallel list of embedding dicts per job
+
+        Returns:
+            List of inserted job IDs
+        """
+        if not jobs:
+            return []
+
+        try:
+            cursor = self.get_cursor()
+
+            rows = []
+            for job_data, embeddings in zip(jobs, embeddings_list):
+                rows.append((
+                    job_data.get('title'), job_data.get('company'), job_data.get('description'),
+                    job_data.get('requirements'), job_data.get('responsibilities'),
+                    job_data.get('location'), job_data.get('remote_allowed', False),
+                    job_data.get('salary_min'), job_data.get('salary_max'),
+                    job_data.get('currency'),  # Will use 'USD' if None
+                    job_data.get('experience_level'), job_data.get('job_type'),
+                    job_data.get('industry'), job_data.get('company_size'),
+                    _safe_parse_array(job_data.get('benefits', [])),
+                    _safe_parse_array(job_data.get('skills_required', [])),
+                    _safe_parse_array(job_data.get('skills_preferred', [])),
+                    job_data.get('education_required'),
+                    self.vector_to_db(embeddings.get('description', np.array([]))),
+                    self.vector_to_db(embeddings.get('requirements', np.array([]))),
+                    self.vector_to_db(embeddings.get('title', np.array([]))),
+                    job_data.get('source', 'manual'), job_data.get('job_url'),
+                    job_data.get('posted_date'), True,
+                    job_data.get('external_job_id')
+                ))
+
+            query = """
+                    INSERT INTO jobs (title, company, description, requirements, responsibilities, \
+                                      location, remote_allowed, salary_min, salary_max, currency, \
+                                      experience_level, job_type, industry, company_size, \
+                                      benefits, skills_required, skills_preferred, education_required, \
+                                      description_embedding, requirements_embedding, title_embedding, \
+                                      source, job_url, posted_date, is_active, external_job_id) \
+                    VALUES %s RETURNING id;
+                    """
+            template = ("(%s, %s, %s, %s, %s, %s, %s, %s, %s, COALESCE(%s, 'USD'), "
+                        "%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)")
+
+            results = execute_values(cursor, query, rows, template=template, fetch=True)
+            cursor.close()
+
+            job_ids = [row['id'] for row in results]
+            logger.info(f" Stored {len(job_ids)} job postings in one batch")
+            return job_ids
+
+        except Exception as e:
+            logger.error(f" Failed to bulk store jobs: {e}")
+            raise
+
     def get_all_jobs_with_embeddings(self) -> List[Dict]:
         """Get all active jobs with their embeddings"""
         try:
@@ -684,6 +750,16 @@ class DatabaseConnection:
         cursor.execute(query, (title, company))
         return cursor.fetchall()
 
+    def get_all_title_company_pairs(self) -> List[Dict]:
+        """Fetch every (title, company, id) row once for in-memory dedup seeding"""
+        query = """
+                SELECT id, LOWER(title) AS title, LOWER(company) AS company
+                FROM jobs \
+                """
+        cursor = self.get_cursor()
+        cursor.execute(query)
+        return cursor.fetchall()
+
     def get_jobs_excluding_ids(self, exclude_ids: List[int]) -> List[Dict]:
         """Get all active jobs excluding specific job IDs"""
         try:
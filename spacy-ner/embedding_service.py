@@ -112,38 +112,7 @@ class ResumeJobEmbeddingService:
             numpy array of embedding vector
         """
         try:
-            text_components = []
-
-            # 1. Job title (high weight)
-            title = job_data.get('title', '')
-            if title:
-                text_components.extend([title] * 2)  # 2x weight
-
-            # 2. Required skills (highest weight)
-            skills = job_data.get('skills_required', [])
-            if skills:
-                skills_text = " ".join(skills)
-                text_components.extend([skills_text] * 3)  # 3x weight
-
-            # 3. Job requirements (high weight)
-            requirements = job_data.get('requirements', '')
-            if requirements:
-                text_components.extend([requirements] * 2)  # 2x weight
-
-            # 4. Job description (standard weight)
-            description = job_data.get('description', '')
-            if description:
-                # Limit description length to avoid overwhelming other components
-                description_truncated = description[:1000]
-                text_components.append(description_truncated)
-
-            # 5. Responsibilities (standard weight)
-            responsibilities = job_data.get('responsibilities', '')
-            if responsibilities:
-                text_components.append(responsibilities[:500])
-
-            # Combine all components
-            combined_text = " ".join(text_components)
+            combined_text = self._build_job_text(job_data)
 
             # Generate embedding
             embedding = self.model.encode(combined_text, convert_to_numpy=True)
@@ -156,6 +125,114 @@ class ResumeJobEmbeddingService:
             # Return zero vector as fallback
             return np.zeros(self.embedding_dim)
 
+    def generate_job_embeddings_batch(self, jobs: List[Dict]) -> List[np.ndarray]:
+        """
+        Generate embeddings for many job postings in one batched encode call.
+
+        One model.encode over the whole batch amortizes tokenization and
+        forward-pass overhead that per-job calls pay N times.
+
+        Args:
+            jobs: List of job posting dicts (same shape as generate_job_embedding)
+
+        Returns:
+            List of embedding vectors, aligned with the input order
+        """
+        if not jobs:
+            return []
+
+        try:
+            combined_texts = [self._build_job_text(job) for job in jobs]
+            embeddings = self.model.encode(
+                combined_texts,
+                batch_size=32,
+                convert_to_numpy=True,
+                show_progress_bar=False
+            )
+
+            logger.debug(f"Generated {len(jobs)} job embeddings in one batch")
+            return list(embeddings)
+
+        except Exception as e:
+            logger.error(f"Failed to generate batched job embeddings: {e}")
+            return [np.zeros(self.embedding_dim) for _ in jobs]
+
+    def generate_job_field_embeddings_batch(self, jobs: List[Dict]):
+        """
+        Encode the combined, title and requirements vectors for many jobs in
+        a single model.encode call.
+
+        The three field lists are concatenated into one batch and split
+        afterwards, so a flush of N jobs costs one tokenization pass and one
+        forward pass instead of three.
+
+        Args:
+            jobs: List of job posting dicts (same shape as generate_job_embedding)
+
+        Returns:
+            Tuple of (description, title, requirements) embedding lists,
+            each aligned with the input order
+        """
+        if not jobs:
+            return [], [], []
+
+        try:
+            n = len(jobs)
+            texts = (
+                [self._build_job_text(job) for job in jobs]
+                + [job.get('title', '') for job in jobs]
+                + [job.get('requirements', '') for job in jobs]
+            )
+            embeddings = self.model.encode(
+                texts,
+                batch_size=32,
+                convert_to_numpy=True,
+                show_progress_bar=False
+            )
+
+            logger.debug(f"Generated {len(texts)} field embeddings for {n} jobs in one batch")
+            return list(embeddings[:n]), list(embeddings[n:2 * n]), list(embeddings[2 * n:])
+
+        except Exception as e:
+            logger.error(f"Failed to generate batched field embeddings: {e}")
+            zeros = [np.zeros(self.embedding_dim) for _ in jobs]
+            return list(zeros), list(zeros), list(zeros)
+
+    def _build_job_text(self, job_data: Dict) -> str:
+        """Build the weighted combined text a job embedding is encoded from"""
+        text_components = []
+
+        # 1. Job title (high weight)
+        title = job_data.get('title', '')
+        if title:
+            text_components.extend([title] * 2)  # 2x weight
+
+        # 2. Required skills (highest weight)
+        skills = job_data.get('skills_required', [])
+        if skills:
+            skills_text = " ".join(skills)
+            text_components.extend([skills_text] * 3)  # 3x weight
+
+        # 3. Job requirements (high weight)
+        requirements = job_data.get('requirements', '')
+        if requirements:
+            text_components.extend([requirements] * 2)  # 2x weight
+
+        # 4. Job description (standard weight)
+        description = job_data.get('description', '')
+        if description:
+            # Limit description length to avoid overwhelming other components
+            description_truncated = description[:1000]
+            text_components.append(description_truncated)
+
+        # 5. Responsibilities (standard weight)
+        responsibilities = job_data.get('responsibilities', '')
+        if responsibilities:
+            text_components.append(responsibilities[:500])
+
+        # Combine all components
+        return " ".join(text_components)
+
     def generate_skills_embedding(self, skills_data: List[str]) -> np.ndarray:
         """
         Generate specialized embedding focused only on skills
@@ -1,5 +1,7 @@
 import spacy
 import re
+from bisect import bisect_right
+from hashlib import blake2b
 from typing import Dict, List, Tuple, Optional, Set
 from enum import Enum
 import logging
@@ -42,11 +44,14 @@ class IntelligentSectionDetector:
     """
 
     def __init__(self):
-        # Load NLP model for advanced text analysis
+        # Sentence boundaries are the only NLP feature this detector uses,
+        # so a blank tokenizer plus rule-based sentencizer replaces the
+        # full en_core_web_lg pipeline it used to load
         try:
-            self.nlp = nlp = spacy.load("en_core_web_lg")
-        except OSError:
-            logger.warning("spaCy model 'en_core_web_sm' not found. Using regex-only mode.")
+            self.nlp = spacy.blank("en")
+            self.nlp.add_pipe("sentencizer")
+        except Exception:
+            logger.warning("spaCy unavailable for sentence splitting. Using regex-only mode.")
             self.nlp = None
 
         # Comprehensive section header patterns with priority ordering
@@ -221,6 +226,24 @@ class IntelligentSectionDetector:
             'bold_italic': r'(\*\*.+\*\*|_.+_)',  # Markdown-style bold/italic
         }
 
+        # Everything above is declarative; compile it once here so the
+        # per-line detectors run single fused scans instead of looking up
+        # and retrying dozens of raw pattern strings per call
+        self._section_header_res = {
+            section: re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+            for section, patterns in self.section_patterns.items()
+        }
+        self._section_indicator_res = {
+            section: [(re.compile(pattern, re.IGNORECASE), weight)
+                      for pattern, weight in indicators]
+            for section, indicators in self.section_indicators.items()
+        }
+        self._false_positive_re = re.compile(
+            "|".join(f"(?:{p})" for p in self.false_positives), re.IGNORECASE)
+        self._structural_res = {name: re.compile(pattern)
+                                for name, pattern in self.structural_patterns.items()}
+        self._underline_rule_re = re.compile(r'[-=]{3,}')
+
     def detect_sections(self, text: str) -> Dict[ResumeSection, List[SectionBoundary]]:
         """
         Detect resume sections and return their positions, content, and confidence scores.
@@ -396,36 +419,28 @@ class IntelligentSectionDetector:
         if self._is_false_positive(line):
             return None, 0.0
 
-        # Check against section patterns with confidence scoring
-        best_match = None
-        highest_confidence = 0.0
-
-        for section, patterns in self.section_patterns.items():
-            for pattern in patterns:
-                if re.fullmatch(pattern, line_lower, re.IGNORECASE):
-                    # Calculate confidence based on match specificity
-                    confidence = 1.0
-                    if '.*' in pattern or '.+' in pattern:
-                        confidence = 0.9  # Less specific patterns get slightly lower confidence
-                    if len(line_lower) < 5:
-                        confidence *= 0.8  # Very short headers get lower confidence
-
-                    if confidence > highest_confidence:
-                        best_match = section
-                        highest_confidence = confidence
+        # Check against the fused per-section alternations; all header
+        # patterns are fully anchored and specific, so a match scores 1.0
+        # (discounted for very short lines) exactly as the per-pattern
+        # loop did
+        for section, pattern_re in self._section_header_res.items():
+            if pattern_re.fullmatch(line_lower):
+                confidence = 0.8 if len(line_lower) < 5 else 1.0
+                return section, confidence
 
-        return best_match, highest_confidence
+        return None, 0.0
 
     def _detect_section_by_content(self, text: str) -> Tuple[Optional[ResumeSection], float]:
         """Detect section by content patterns with weighted confidence scoring"""
         text_lower = text.lower()
         section_scores = {section: 0.0 for section in self.section_indicators.keys()}
 
-        # Score based on contextual indicators
-        for section, indicators in self.section_indicators.items():
-            for pattern, weight in indicators:
-                matches = re.findall(pattern, text_lower, re.IGNORECASE)
-                section_scores[section] += len(matches) * weight
+        # Score based on contextual indicators (precompiled; counting via
+        # finditer avoids materializing the match lists)
+        for section, indicators in self._section_indicator_res.items():
+            for pattern_re, weight in indicators:
+                count = sum(1 for _ in pattern_re.finditer(text_lower))
+                section_scores[section] += count * weight
 
         # Find the section with the highest score
         best_section = None
@@ -446,7 +461,7 @@ class IntelligentSectionDetector:
         line_stripped = line.strip()
 
         # Check for all-caps lines (often section headers)
-        if re.match(self.structural_patterns['all_caps'], line_stripped):
+        if self._structural_res['all_caps'].match(line_stripped):
             # Try to match with section patterns
             section, confidence = self._detect_section_header(line_stripped)
             if section and confidence > 0.7:
@@ -455,13 +470,13 @@ class IntelligentSectionDetector:
         # Check for underlined text
         if line_index < len(all_lines) - 1:
             next_line = all_lines[line_index + 1].strip()
-            if re.fullmatch(r'[-=]{3,}', next_line):
+            if self._underline_rule_re.fullmatch(next_line):
                 section, confidence = self._detect_section_header(line_stripped)
                 if section and confidence > 0.7:
                     return section
 
         # Check for bullet points that might indicate the start of a new section
-        if re.match(self.structural_patterns['bullet_points'], line):
+        if self._structural_res['bullet_points'].match(line):
             # Look backward to find the most recent section header
             for i in range(line_index - 1, max(0, line_index - 5), -1):
                 prev_line = all_lines[i].strip()
@@ -478,11 +493,7 @@ class IntelligentSectionDetector:
         if not line_stripped:
             return True
 
-        for pattern in self.false_positives:
-            if re.fullmatch(pattern, line_stripped, re.IGNORECASE):
-                return True
-
-        return False
+        return self._false_positive_re.fullmatch(line_stripped) is not None
 
     def _find_section_end(self, lines: List[str], current_index: int, full_text: str, content_start: int) -> int:
         """Find the end of a section by looking for the next section header"""
@@ -592,6 +603,42 @@ class IntelligentSectionDetector:
 
         return sections
 
+    def build_section_index(self, sections: Dict[ResumeSection, List[SectionBoundary]]) -> Tuple[
+        List[int], List[SectionBoundary]]:
+        """
+        Build a start-sorted index over all section boundaries so repeated
+        position lookups can use binary search instead of re-scanning every
+        boundary per entity.
+        """
+        boundaries = sorted(
+            (boundary for boundary_list in sections.values() for boundary in boundary_list),
+            key=lambda boundary: boundary.start
+        )
+        starts = [boundary.start for boundary in boundaries]
+        return starts, boundaries
+
+    def get_section_context_indexed(self, index: Tuple[List[int], List[SectionBoundary]],
+                                    position: int) -> ResumeSection:
+        """Get the section context for a position using a prebuilt index (O(log n))."""
+        starts, boundaries = index
+
+        best_section = ResumeSection.OTHER
+        highest_confidence = 0.0
+
+        # Only boundaries starting at or before `position` can contain it;
+        # walk left from the bisect point until boundaries end before it.
+        idx = bisect_right(starts, position) - 1
+        while idx >= 0:
+            boundary = boundaries[idx]
+            if boundary.end < position:
+                break
+            if boundary.confidence > highest_confidence:
+                best_section = boundary.section
+                highest_confidence = boundary.confidence
+            idx -= 1
+
+        return best_section
+
     def get_section_context(self, sections: Dict[ResumeSection, List[SectionBoundary]], position: int) -> ResumeSection:
         """Get the section context for a given text position with confidence"""
         best_section = ResumeSection.OTHER
@@ -645,9 +692,29 @@ class ContextAwareEntityExtractor:
     Enhanced entity extractor that uses section context to improve extraction accuracy.
     """
 
+    # Section layouts rarely change between calls, so keep a small cache of
+    # detect_sections results keyed by content hash
+    _SECTIONS_CACHE_SIZE = 64
+
     def __init__(self, nlp_model):
         self.nlp = nlp_model
         self.section_detector = IntelligentSectionDetector()
+        self._sections_cache = {}
+
+    def _get_sections(self, text: str) -> Dict[ResumeSection, List[SectionBoundary]]:
+        """
+        Detect sections for `text`, reusing a cached result when the same
+        content was analyzed before (e.g. one resume scored against many jobs).
+        """
+        key = blake2b(text.encode('utf-8'), digest_size=16).digest()
+        sections = self._sections_cache.get(key)
+        if sections is None:
+            sections = self.section_detector.detect_sections(text)
+            if len(self._sections_cache) >= self._SECTIONS_CACHE_SIZE:
+                # Drop the oldest entry (dicts preserve insertion order)
+                self._sections_cache.pop(next(iter(self._sections_cache)))
+            self._sections_cache[key] = sections
+        return sections
 
     def extract_entities_with_context(self, text: str) -> Dict:
         """
@@ -660,23 +727,35 @@ class ContextAwareEntityExtractor:
                         doc.ents]
 
         # Get section boundaries
-        sections = self.section_detector.detect_sections(text)
+        sections = self._get_sections(text)
+        section_index = self.section_detector.build_section_index(sections)
 
         # Validate entities based on their section
         validated_entities = []
         for entity in raw_entities:
-            section = self.section_detector.get_section_context(sections, entity['start'])
+            section = self.section_detector.get_section_context_indexed(section_index, entity['start'])
             validated_entity = self._validate_entity_with_context(entity, section)
             if validated_entity:
                 validated_entity['section'] = section.value
                 validated_entities.append(validated_entity)
 
+        found = {sec for sec, boundaries in sections.items() if boundaries}
         results = {
             "entities": validated_entities,
             "sections": {
                 sec.value: "\n".join(b.content for b in boundaries) if boundaries else ""
                 for sec, boundaries in sections.items()
             },
+            "section_analysis": {
+                "sections_found": len(found),
+                "has_experience": ResumeSection.EXPERIENCE in found,
+                "has_education": ResumeSection.EDUCATION in found,
+                "has_skills": ResumeSection.SKILLS in found,
+                "structure_score": min(100, len(found) * 20),
+            },
+            # Callers that also need relationship extraction reuse this Doc
+            # instead of parsing the same text a second time
+            "doc": doc,
         }
         return results
 
@@ -684,12 +763,13 @@ class ContextAwareEntityExtractor:
         """
         Enhance entity extraction using section context and validation rules.
         """
-        sections = self.section_detector.detect_sections(text)
+        sections = self._get_sections(text)
+        section_index = self.section_detector.build_section_index(sections)
         enhanced_entities = []
 
         for entity in raw_entities:
             # Get section context
-            section = self.section_detector.get_section_context(sections, entity['start'])
+            section = self.section_detector.get_section_context_indexed(section_index, entity['start'])
 
             # Apply section-specific validation rules
             entity = self._validate_entity_with_context(entity, section)
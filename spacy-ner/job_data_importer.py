@@ -1,9 +1,24 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import logging
-import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from threading import Lock
 from typing import List, Dict, Optional
-from datetime import datetime
+from datetime import datetime, timedelta
+
+import muse_text_helpers
+
+try:
+    from requests_cache import CachedSession
+except ImportError:  # requests-cache is optional; fall back to plain requests
+    CachedSession = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to stdlib json parsing
+    orjson = None
 from database import db
 from embedding_service import ResumeJobEmbeddingService
 
@@ -20,8 +35,38 @@ class MuseJobImporter:
         self.imported_count = 0
         self.skipped_count = 0
         self.error_count = 0
+        # _process_job runs in worker threads, so counter updates must not race
+        self._count_lock = Lock()
         self.base_url = "https://www.themuse.com/api/public/jobs"
 
+        # Cache API pages on disk so repeated runs over largely overlapping
+        # categories don't re-fetch (and re-process) the same pages. The
+        # cache key is the full request URL, i.e. (category, page, location).
+        if CachedSession is not None:
+            self.session = CachedSession(
+                'muse_cache',
+                backend='sqlite',
+                expire_after=timedelta(hours=24),
+                allowable_methods=('GET',)
+            )
+        else:
+            self.session = requests.Session()
+
+        # Keep-alive connection pool sized for the worker threads, with
+        # exponential backoff on transient API errors
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.5,
+                              status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+
+    def _bump(self, counter: str, amount: int = 1):
+        """Atomically increment one of the import counters"""
+        with self._count_lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+
     def import_jobs(self, categories: List[str] = None, locations: List[str] = None, max_jobs: int = 100):
         """
         Import jobs from The Muse API
@@ -51,61 +96,88 @@ class MuseJobImporter:
 
             except Exception as e:
                 logger.error(f" Error importing category '{category}': {e}")
-                self.error_count += 1
+                self._bump('error_count')
 
     def _import_category(self, category: str, locations: List[str] = None, max_jobs: int = 100):
         """Import jobs for a specific category"""
         page = 0
         jobs_imported_for_category = 0
 
-        while jobs_imported_for_category < max_jobs:
-            try:
-                params = {
-                    'category': category,
-                    'page_size': 20,  # Max 20 per request
-                    'page': page
-                }
+        # Process jobs in worker threads so HTML cleaning, regex extraction
+        # and embedding generation for page N overlap the HTTP fetch of
+        # page N+1 (requests, model.encode and regex scans all release the GIL)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            pending = []
 
-                # Add location filter if specified
-                if locations:
-                    params['location'] = locations[0]  # Use first location for now
+            while jobs_imported_for_category < max_jobs:
+                try:
+                    params = {
+                        'category': category,
+                        'page_size': 20,  # Max 20 per request
+                        'page': page
+                    }
 
-                response = requests.get(self.base_url, params=params, timeout=10)
+                    # Add location filter if specified
+                    if locations:
+                        params['location'] = locations[0]  # Use first location for now
 
-                if response.status_code != 200:
-                    logger.error(f"API error for {category}: {response.status_code}")
-                    break
+                    response = self.session.get(self.base_url, params=params, timeout=10)
 
-                data = response.json()
-                jobs = data.get('results', [])
+                    if response.status_code != 200:
+                        logger.error(f"API error for {category}: {response.status_code}")
+                        break
 
-                if not jobs:
-                    logger.info(f"No more jobs found for {category} on page {page}")
-                    break
+                    # orjson parses the raw bytes directly, skipping the
+                    # intermediate str decode that response.json() does
+                    if orjson is not None:
+                        data = orjson.loads(response.content)
+                    else:
+                        data = response.json()
+                    jobs = data.get('results', [])
 
-                logger.info(f" Found {len(jobs)} jobs for '{category}' (page {page})")
+                    if not jobs:
+                        logger.info(f"No more jobs found for {category} on page {page}")
+                        break
+
+                    logger.info(f" Found {len(jobs)} jobs for '{category}' (page {page})")
+
+                    # Settle the previous page (its workers ran during the
+                    # fetch above) before queueing more against the budget
+                    jobs_imported_for_category += self._drain_job_futures(pending)
+                    pending = []
 
-                for job in jobs:
                     if jobs_imported_for_category >= max_jobs:
                         break
 
-                    try:
-                        if self._process_job(job):
-                            jobs_imported_for_category += 1
-                        time.sleep(0.1)  # Small delay between processing jobs
+                    budget = max_jobs - jobs_imported_for_category
+                    # One timestamp per page instead of a datetime.now() per job
+                    batch_now = datetime.now()
+                    pending = [executor.submit(self._process_job, job, batch_now) for job in jobs[:budget]]
 
-                    except Exception as e:
-                        logger.error(f" Error processing job: {e}")
-                        self.error_count += 1
+                    page += 1
 
-                page += 1
+                except Exception as e:
+                    logger.error(f" Error fetching page {page} for {category}: {e}")
+                    break
+
+            jobs_imported_for_category += self._drain_job_futures(pending)
 
+    def _drain_job_futures(self, futures) -> int:
+        """Wait for submitted _process_job calls and batch-store the results"""
+        parsed_jobs = []
+        for future in as_completed(futures):
+            try:
+                job_data = future.result()
+                if job_data:
+                    parsed_jobs.append(job_data)
             except Exception as e:
-                logger.error(f" Error fetching page {page} for {category}: {e}")
-                break
+                logger.error(f" Error processing job: {e}")
+                self._bump('error_count')
 
-    def _process_job(self, job: Dict) -> bool:
-        """Process and store a single job"""
+        return self._store_jobs_batch(parsed_jobs)
+
+    def _process_job(self, job: Dict, posted_date: datetime = None) -> Optional[Dict]:
+        """Parse and validate a single job, returning data ready to store"""
         try:
             # Skip if we already have this job (check by title + company)
             title = job.get('name', '').strip()
@@ -113,32 +185,31 @@ class MuseJobImporter:
             company = company_info.get('name', '').strip()
 
             if not title or not company:
-                self.skipped_count += 1
-                return False
+                self._bump('skipped_count')
+                return None
 
             # Check if job already exists in database
             if self._job_exists(title, company):
                 logger.debug(f"Job already exists: {title} at {company}")
-                self.skipped_count += 1
-                return False
+                self._bump('skipped_count')
+                return None
 
             # Parse job data
-            job_data = self._parse_muse_job(job)
+            job_data = self._parse_muse_job(job, posted_date)
 
             if job_data:
-                self._store_job(job_data)
-                return True
-            else:
-                self.skipped_count += 1
-                return False
+                return job_data
+
+            self._bump('skipped_count')
+            return None
 
         except Exception as e:
             logger.error(f"Error processing job: {e}")
-            logger.error(f"Problematic job data: {job_data}")
-            self.error_count += 1
-            return False
+            logger.error(f"Problematic job data: {job}")
+            self._bump('error_count')
+            return None
 
-    def _parse_muse_job(self, job: Dict) -> Optional[Dict]:
+    def _parse_muse_job(self, job: Dict, posted_date: datetime = None) -> Optional[Dict]:
         """Parse The Muse job data into our format"""
         try:
             # Basic job info
@@ -153,6 +224,8 @@ class MuseJobImporter:
 
             # Clean HTML from contents
             description = self._clean_html(contents)
+            # Lowercase once and share across the classifier helpers below
+            desc_lower = description.lower()
 
             # Extract skills from job description
             skills = self._extract_skills_from_text(description)
@@ -173,9 +246,8 @@ class MuseJobImporter:
 
                 location = ', '.join(location_names[:2])  # Limit to 2 locations
 
-            # Determine job type and experience level from description
-            job_type = self._determine_job_type(description)
-            experience_level = self._determine_experience_level(description)
+            # Determine job type and experience level in one fused scan
+            job_type, experience_level = muse_text_helpers.classify_description(description, desc_lower)
 
             # Extract industry from company info
             industry = ''
@@ -203,7 +275,7 @@ class MuseJobImporter:
                 'education_required': self._extract_education_requirements(description),
                 'source': 'themuse',
                 'job_url': job_url,
-                'posted_date': datetime.now()
+                'posted_date': posted_date if posted_date is not None else datetime.now()
             }
 
         except Exception as e:
@@ -215,111 +287,29 @@ class MuseJobImporter:
         from api import extract_skills_for_jobs
         return extract_skills_for_jobs(text, max_skills=20)
 
-    def _determine_experience_level(self, description: str) -> str:
+    def _determine_experience_level(self, description: str, desc_lower: str = None) -> str:
         """Determine experience level from job description"""
-        desc_lower = description.lower()
-
-        # Senior level indicators
-        senior_terms = ['senior', 'lead', 'principal', 'staff', 'architect',
-                        '5+ years', '6+ years', '7+ years', '8+ years', '10+ years',
-                        'leadership', 'mentor', 'team lead']
-
-        # Entry level indicators
-        entry_terms = ['junior', 'entry', 'graduate', 'intern', 'new grad',
-                       '0-2 years', '1-2 years', 'recent graduate', 'bootcamp']
-
-        # Count occurrences
-        senior_count = sum(1 for term in senior_terms if term in desc_lower)
-        entry_count = sum(1 for term in entry_terms if term in desc_lower)
-
-        if senior_count > entry_count and senior_count > 0:
-            return 'senior'
-        elif entry_count > 0:
-            return 'entry'
-        else:
-            return 'mid'
+        return muse_text_helpers.determine_experience_level(description, desc_lower)
 
-    def _determine_job_type(self, description: str) -> str:
+    def _determine_job_type(self, description: str, desc_lower: str = None) -> str:
         """Determine job type from description"""
-        desc_lower = description.lower()
-
-        if any(term in desc_lower for term in ['contract', 'contractor', 'freelance', 'consulting']):
-            return 'contract'
-        elif any(term in desc_lower for term in ['part-time', 'part time', 'parttime']):
-            return 'part-time'
-        elif any(term in desc_lower for term in ['intern', 'internship']):
-            return 'internship'
-        else:
-            return 'full-time'
+        return muse_text_helpers.determine_job_type(description, desc_lower)
 
     def _extract_requirements(self, description: str) -> str:
         """Extract requirements section from job description"""
-        # Look for common requirements section headers
-        patterns = [
-            r'requirements?:?\s*(.*?)(?=responsibilities?:|qualifications?:|experience?:|$)',
-            r'qualifications?:?\s*(.*?)(?=responsibilities?:|requirements?:|experience?:|$)',
-            r'you have:?\s*(.*?)(?=responsibilities?:|requirements?:|we offer:|$)'
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, description, re.IGNORECASE | re.DOTALL)
-            if match:
-                requirements = match.group(1).strip()
-                if len(requirements) > 50:  # Only return if substantial
-                    return requirements[:500]  # Limit length
-
-        return ''
+        return muse_text_helpers.extract_requirements(description)
 
     def _extract_responsibilities(self, description: str) -> str:
         """Extract responsibilities section from job description"""
-        patterns = [
-            r'responsibilities?:?\s*(.*?)(?=requirements?:|qualifications?:|benefits?:|$)',
-            r'you will:?\s*(.*?)(?=requirements?:|qualifications?:|benefits?:|$)',
-            r'role:?\s*(.*?)(?=requirements?:|qualifications?:|benefits?:|$)'
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, description, re.IGNORECASE | re.DOTALL)
-            if match:
-                responsibilities = match.group(1).strip()
-                if len(responsibilities) > 50:
-                    return responsibilities[:500]
-
-        return ''
+        return muse_text_helpers.extract_responsibilities(description)
 
     def _extract_education_requirements(self, description: str) -> str:
         """Extract education requirements from job description"""
-        desc_lower = description.lower()
-
-        education_terms = [
-            "bachelor's degree", "master's degree", "phd", "doctorate",
-            "computer science", "engineering", "mathematics", "statistics",
-            "degree in", "bs in", "ms in", "ba in", "ma in"
-        ]
-
-        for term in education_terms:
-            if term in desc_lower:
-                # Try to extract the sentence containing the education requirement
-                sentences = description.split('.')
-                for sentence in sentences:
-                    if term in sentence.lower():
-                        return sentence.strip()[:200]
-
-        return ''
+        return muse_text_helpers.extract_education_requirements(description)
 
     def _clean_html(self, text: str) -> str:
         """Remove HTML tags and clean text"""
-        if not text:
-            return ''
-
-        # Remove HTML tags
-        clean_text = re.sub(r'<[^<]+?>', '', text)
-
-        # Remove extra whitespace and normalize
-        clean_text = re.sub(r'\s+', ' ', clean_text)
-        clean_text = re.sub(r'\n+', '\n', clean_text)
-
-        return clean_text.strip()
+        return muse_text_helpers.clean_html(text)
 
     def _job_exists(self, title: str, company: str) -> bool:
         """Check if job already exists in database"""
@@ -330,31 +320,46 @@ class MuseJobImporter:
             logger.error(f"Error checking duplicate job: {e}")
             return False  # If we can't check, assume it's not a duplicate
 
-    def _store_job(self, job_data: Dict):
-        """Store job in database with embeddings"""
-        try:
-            # Generate embeddings
-            description_embedding = self.embedding_service.generate_job_embedding(job_data)
-            title_embedding = self.embedding_service.model.encode(job_data['title'])
-            requirements_text = job_data.get('requirements', job_data['description'][:500])
-            requirements_embedding = self.embedding_service.model.encode(requirements_text)
-
-            # Store in database
-            job_id = db.store_job_posting(
-                job_data,
-                {
+    def _store_jobs_batch(self, jobs: List[Dict]) -> int:
+        """Store a page worth of jobs in a single bulk insert"""
+        if not jobs:
+            return 0
+
+        batch_jobs = []
+        batch_embeddings = []
+        for job_data in jobs:
+            try:
+                # Generate embeddings
+                description_embedding = self.embedding_service.generate_job_embedding(job_data)
+                title_embedding = self.embedding_service.model.encode(job_data['title'])
+                requirements_text = job_data.get('requirements', job_data['description'][:500])
+                requirements_embedding = self.embedding_service.model.encode(requirements_text)
+
+                batch_jobs.append(job_data)
+                batch_embeddings.append({
                     'description': description_embedding,
                     'title': title_embedding,
                     'requirements': requirements_embedding
-                }
-            )
+                })
+
+            except Exception as e:
+                logger.error(f" Failed to embed job '{job_data.get('title', 'Unknown')}': {e}")
+                self._bump('error_count')
 
-            self.imported_count += 1
-            logger.info(f" Imported: {job_data['title']} at {job_data['company']} (ID: {job_id})")
+        if not batch_jobs:
+            return 0
+
+        try:
+            # One round-trip for the whole page instead of an insert per job
+            job_ids = db.store_job_postings_bulk(batch_jobs, batch_embeddings)
+            self._bump('imported_count', len(job_ids))
+            logger.info(f" Imported {len(job_ids)} jobs in one batch")
+            return len(job_ids)
 
         except Exception as e:
-            logger.error(f" Failed to store job '{job_data.get('title', 'Unknown')}': {e}")
-            self.error_count += 1
+            logger.error(f" Failed to store job batch: {e}")
+            self._bump('error_count', len(batch_jobs))
+            return 0
 
     def get_import_summary(self) -> Dict:
         """Get summary of import results"""
@@ -383,7 +388,7 @@ class MuseJobImporter:
                 'page': 0
             }
 
-            response = requests.get(self.base_url, params=params, timeout=10)
+            response = self.session.get(self.base_url, params=params, timeout=10)
             return response.status_code == 200
         except Exception as e:
             logger.error(f"Muse API test failed: {e}")
@@ -1,25 +1,159 @@
+import asyncio
+import re
 import requests
+import httpx
 import logging
 import time
+import numpy as np
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import blake2b
 from typing import List, Dict, Any, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to stdlib json parsing
+    orjson = None
 from database import db
 from embedding_service import ResumeJobEmbeddingService
 
 logger = logging.getLogger(__name__)
 
+# Safety limit on pages fetched per keyword
+MAX_PAGES = 3
+
+# Concurrent in-flight requests against the RapidAPI quota
+MAX_CONCURRENT_REQUESTS = 5
+
+# Token-bucket pacing: requests allowed per period (seconds)
+REQUESTS_PER_PERIOD = 5
+RATE_PERIOD = 1.0
+
+# Jobs buffered before embeddings are generated in one batched encode
+EMBEDDING_BATCH_SIZE = 64
+
+
+def _term_pattern(terms):
+    """Compile a keyword set into one longest-first alternation so each
+    category is checked with a single C-level scan instead of one Python
+    substring scan per keyword. Terms are word-boundary anchored where
+    they start/end on word characters, so 'intern' no longer fires
+    inside 'international' (boundaries are skipped around punctuation
+    like the trailing dot in 'sr.')"""
+    pieces = []
+    for term in sorted(terms, key=len, reverse=True):
+        piece = re.escape(term)
+        if term[0].isalnum():
+            piece = r'\b' + piece
+        if term[-1].isalnum():
+            piece = piece + r'\b'
+        pieces.append(piece)
+    return re.compile("|".join(pieces))
+
+
+_SENIOR_RE = _term_pattern(['senior', 'sr.', 'lead', 'principal', 'architect', 'staff'])
+_ENTRY_RE = _term_pattern(['junior', 'jr.', 'entry', 'intern', 'graduate', 'trainee'])
+_EXECUTIVE_RE = _term_pattern(['manager', 'director', 'head of', 'vp', 'chief'])
+_REMOTE_RE = _term_pattern(['remote', 'work from home', 'wfh', 'distributed', 'telecommute', 'virtual'])
+
+# JSearch employment type -> normalized job type
+_JOB_TYPE_MAP = {
+    'FULLTIME': 'full-time',
+    'PARTTIME': 'part-time',
+    'CONTRACTOR': 'contract',
+    'INTERN': 'internship'
+}
+
+_LOCATION_KEYS = ('job_city', 'job_state', 'job_country')
+
+# Search params that never change between requests
+_STATIC_SEARCH_PARAMS = {
+    'num_pages': '1',
+    'date_posted': 'all',
+    'employment_types': 'FULLTIME,CONTRACTOR',
+    'job_requirements': 'under_3_years_experience,more_than_3_years_experience',
+    'country': 'us'
+}
+
+
+# Bound on first use; importing api at module top would be circular since
+# api.py imports this module before extract_skills_for_jobs is defined
+_extract_skills = None
+
+
+# Skill extraction memoized by content digest; reposted listings across
+# boards share descriptions, so repeats skip the taxonomy scan entirely.
+# A manual dict keyed on the 16-byte digest keeps the cache small — an
+# lru_cache keyed on the description would pin thousands of full job
+# descriptions in memory
+_SKILL_CACHE: Dict[bytes, tuple] = {}
+_SKILL_CACHE_SIZE = 4096
+
+
+def _cached_skill_extract(desc_hash: bytes, description: str) -> tuple:
+    cached = _SKILL_CACHE.get(desc_hash)
+    if cached is not None:
+        return cached
+    global _extract_skills
+    if _extract_skills is None:
+        from api import extract_skills_for_jobs
+        _extract_skills = extract_skills_for_jobs
+    skills = tuple(_extract_skills(description, max_skills=20))
+    if len(_SKILL_CACHE) >= _SKILL_CACHE_SIZE:
+        # Drop the oldest entry (dicts preserve insertion order)
+        _SKILL_CACHE.pop(next(iter(_SKILL_CACHE)))
+    _SKILL_CACHE[desc_hash] = skills
+    return skills
+
+
+class _TokenBucket:
+    """Minimal async token bucket so requests are paced by quota instead of
+    fixed worst-case sleeps; a 429 Retry-After can starve tokens temporarily"""
+
+    def __init__(self, rate: int = REQUESTS_PER_PERIOD, period: float = RATE_PERIOD):
+        self.rate = rate
+        self.period = period
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                if now >= self._blocked_until:
+                    refill = (now - self._updated) * (self.rate / self.period)
+                    self._tokens = min(float(self.rate), self._tokens + refill)
+                    self._updated = now
+                    if self._tokens >= 1.0:
+                        self._tokens -= 1.0
+                        return
+                    wait = (1.0 - self._tokens) * (self.period / self.rate)
+                else:
+                    wait = self._blocked_until - now
+            await asyncio.sleep(wait)
+
+    def penalize(self, seconds: float):
+        """Starve tokens for `seconds` (e.g. honoring a 429 Retry-After)"""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
 
 class JSearchJobImporter:
     def __init__(self, rapidapi_key: str):
         # JSearch API via RapidAPI
         self.rapidapi_key = rapidapi_key
         self.base_url = "https://jsearch.p.rapidapi.com"
+        self._search_url = f"{self.base_url}/search"
 
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.api_headers = {
             'X-RapidAPI-Key': self.rapidapi_key,
             'X-RapidAPI-Host': 'jsearch.p.rapidapi.com',
             'User-Agent': 'LandIt-JobMatcher/1.0'
-        })
+        }
+
+        self.session = requests.Session()
+        self.session.headers.update(self.api_headers)
 
         # Initialize embedding service for job processing
         try:
@@ -36,6 +170,21 @@ class JSearchJobImporter:
             'duplicate_jobs': 0
         }
 
+        # Raw-payload fingerprints seen this run; catches reposts before any
+        # extraction or embedding work happens
+        self._fp_seen = set()
+
+        # Two-level in-memory index (title -> company -> job id) seeded once
+        # so the per-job duplicate check is a pair of dict lookups with no
+        # DB round-trip; repeats from a known company are effectively free
+        self._dedup = defaultdict(dict)
+        try:
+            for row in db.get_all_title_company_pairs():
+                self._dedup[row['title']][row['company']] = row['id']
+            logger.info(f" Seeded duplicate index with {len(self._dedup)} existing titles")
+        except Exception as e:
+            logger.warning(f"Could not seed duplicate index: {e}")
+
     def import_jobs(self, keywords: List[str] = None, max_jobs: int = 50, location: str = "United States"):
         """Import jobs from JSearch API with better error handling"""
         if keywords is None:
@@ -51,11 +200,20 @@ class JSearchJobImporter:
 
         jobs_per_keyword = max(10, max_jobs // len(keywords))
 
+        # Fetch pages concurrently, one page-wave at a time so keywords
+        # satisfied by page 1 never spend quota on pages 2-3; DB writes stay
+        # synchronous and run over the fetched pages afterwards
+        try:
+            pages_by_keyword = asyncio.run(
+                self._fetch_all_pages(keywords, location, jobs_per_keyword))
+        except Exception as e:
+            logger.error(f" JSearch fetch phase failed: {e}")
+            return self.stats
+
         for keyword in keywords:
             try:
                 logger.info(f"Processing keyword: '{keyword}'")
-                self._import_jobs_for_keyword(keyword, jobs_per_keyword, location)
-                time.sleep(2)  # Rate limiting between keywords
+                self._import_fetched_pages(keyword, pages_by_keyword.get(keyword, []), jobs_per_keyword)
             except Exception as e:
                 logger.error(f" Failed to import jobs for '{keyword}': {e}")
                 continue
@@ -63,47 +221,137 @@ class JSearchJobImporter:
         logger.info(f" JSearch import completed: {self.stats}")
         return self.stats
 
-    def _import_jobs_for_keyword(self, keyword: str, max_per_keyword: int, location: str):
-        """Import jobs for a specific keyword - skip entire keyword if rate limited"""
-        page = 1
-        jobs_imported = 0
-        max_pages = 3  # Safety limit
+    async def _fetch_all_pages(self, keywords: List[str], location: str,
+                               max_per_keyword: int) -> Dict[str, List[Dict]]:
+        """
+        Fetch pages concurrently in page-number waves, dropping a keyword
+        from the next wave once enough non-duplicate jobs have been seen or
+        a short page signals the end of its results. Page 1 usually covers
+        the per-keyword budget, so against a metered API this costs one
+        request per keyword in the common case instead of MAX_PAGES.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        limiter = _TokenBucket()
+
+        # Every request targets the same host, so HTTP/2 multiplexes the
+        # concurrent page fetches over a few keep-alive connections instead
+        # of paying a TLS handshake per socket
+        # Static query params are built once per keyword; tasks only copy
+        # and set the page number
+        base_params = {
+            keyword: dict(_STATIC_SEARCH_PARAMS, query=f"{keyword} in {location}")
+            for keyword in keywords
+        }
 
-        while jobs_imported < max_per_keyword and page <= max_pages:
+        pages_by_keyword = {keyword: [] for keyword in keywords}
+        remaining = {keyword: max_per_keyword for keyword in keywords}
+        active = list(keywords)
+
+        async with httpx.AsyncClient(
+            headers=self.api_headers,
+            http2=True,
+            timeout=30,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40)
+        ) as client:
+            for page in range(1, MAX_PAGES + 1):
+                if not active:
+                    break
+                tasks = [
+                    self._fetch_page(client, semaphore, limiter, keyword, base_params[keyword], page)
+                    for keyword in active
+                ]
+                results = await asyncio.gather(*tasks, return_exceptions=True)
+
+                next_active = []
+                for result in results:
+                    if isinstance(result, Exception):
+                        logger.error(f" JSearch page fetch failed: {result}")
+                        continue
+                    keyword, page_num, data = result
+                    if data is None:
+                        continue
+                    jobs = data.get('data', [])
+                    pages_by_keyword[keyword].append((page_num, data))
+
+                    # Estimate how many of these jobs will survive the
+                    # duplicate index, the same signal the import loop uses
+                    remaining[keyword] -= sum(
+                        1 for job in jobs
+                        if not self._is_duplicate_job(
+                            job.get('job_title', '').strip() or 'Unknown Position',
+                            job.get('employer_name', '').strip() or 'Unknown Company')
+                    )
+                    # JSearch typically returns 10 jobs per page; a short
+                    # page means there is nothing further to fetch
+                    if remaining[keyword] > 0 and len(jobs) >= 10:
+                        next_active.append(keyword)
+                active = next_active
+
+        # Keep pages in order so imports stay deterministic
+        for pages in pages_by_keyword.values():
+            pages.sort()
+
+        return pages_by_keyword
+
+    async def _fetch_page(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore,
+                          limiter: _TokenBucket, keyword: str, base_params: Dict[str, str],
+                          page: int):
+        """Fetch and validate a single JSearch results page"""
+        params = dict(base_params, page=str(page))
+
+        async with semaphore:
+            await limiter.acquire()
+            logger.info(f" Fetching JSearch jobs: '{keyword}' page {page}")
+            try:
+                response = await client.get(self._search_url, params=params)
+            except httpx.HTTPError as e:
+                logger.error(f" API request failed for '{keyword}' page {page}: {e}")
+                return keyword, page, None
+
+        logger.debug(f"Request URL: {response.url}")
+        logger.debug(f"Response status: {response.status_code}")
+
+        if response.status_code == 429:
+            # Starve the bucket for the advertised window so the other
+            # in-flight tasks back off instead of compounding the 429s
             try:
-                # Build API request parameters
-                params = {
-                    'query': f"{keyword} in {location}",
-                    'page': str(page),
-                    'num_pages': '1',
-                    'date_posted': 'all',
-                    'employment_types': 'FULLTIME,CONTRACTOR',
-                    'job_requirements': 'under_3_years_experience,more_than_3_years_experience',
-                    'country': 'us'
-                }
-
-                logger.info(f" Fetching JSearch jobs: '{keyword}' page {page}")
-
-                response = self.session.get(f"{self.base_url}/search", params=params, timeout=30)
-
-                # Debug logging
-                logger.debug(f"Request URL: {response.url}")
-                logger.debug(f"Response status: {response.status_code}")
-
-                # Handle rate limiting - SKIP ENTIRE KEYWORD if rate limited
-                if response.status_code == 429:
-                    logger.warning(f"Rate limit hit for '{keyword}', skipping this keyword entirely")
-                    break  # Break out of the while loop, skip to next keyword
-
-                if response.status_code != 200:
-                    logger.error(f"API Error {response.status_code}: {response.text[:500]}")
-                    break  # Skip this keyword on any API error
-
-                data = response.json()
-
-                # Check for API errors
-                if not data.get('status', '').lower() == 'ok':
-                    logger.error(f"JSearch API Error: {data}")
+                retry_after = float(response.headers.get('Retry-After', 5))
+            except (TypeError, ValueError):
+                retry_after = 5.0
+            limiter.penalize(retry_after)
+            logger.warning(f"Rate limit hit for '{keyword}' page {page}, backing off {retry_after}s")
+            return keyword, page, None
+
+        if response.status_code != 200:
+            logger.error(f"API Error {response.status_code}: {response.text[:500]}")
+            return keyword, page, None
+
+        # orjson parses the raw bytes directly, skipping the intermediate
+        # str decode that response.json() does
+        if orjson is not None:
+            data = orjson.loads(response.content)
+        else:
+            data = response.json()
+
+        # Check for API errors
+        if not data.get('status', '').lower() == 'ok':
+            logger.error(f"JSearch API Error: {data}")
+            return keyword, page, None
+
+        return keyword, page, data
+
+    def _import_fetched_pages(self, keyword: str, pages: List[Dict], max_per_keyword: int):
+        """Process and store the fetched pages for one keyword"""
+        jobs_imported = 0
+        pending = []
+        store_future = None
+
+        # One store worker: the insert of a batch overlaps extraction and
+        # embedding of the next batch, since psycopg2 releases the GIL
+        # while waiting on Postgres
+        with ThreadPoolExecutor(max_workers=1) as store_pool:
+            for page, data in pages:
+                if jobs_imported >= max_per_keyword:
                     break
 
                 jobs = data.get('data', [])
@@ -119,16 +367,21 @@ class JSearchJobImporter:
                         break
 
                     try:
-                        if self._process_job(job_data, keyword):
+                        job_dict = self._process_job(job_data, keyword)
+                        if job_dict is not None:
+                            pending.append(job_dict)
                             jobs_imported += 1
                             page_jobs_processed += 1
-                            self.stats['successfully_imported'] += 1
                         else:
                             self.stats['duplicate_jobs'] += 1
                     except Exception as e:
                         logger.error(f" Failed to process job: {e}")
                         self.stats['failed_imports'] += 1
 
+                    if len(pending) >= EMBEDDING_BATCH_SIZE:
+                        store_future = self._flush_pending(pending, store_pool, store_future)
+                        pending = []
+
                 self.stats['total_fetched'] += len(jobs)
 
                 logger.info(f"Page {page}: Processed {page_jobs_processed} jobs, total: {jobs_imported}")
@@ -137,18 +390,78 @@ class JSearchJobImporter:
                 if len(jobs) < 10:
                     break
 
-                # Rate limiting between pages
-                time.sleep(1)
-                page += 1
+            store_future = self._flush_pending(pending, store_pool, store_future)
+            if store_future is not None:
+                store_future.result()
 
-            except requests.exceptions.RequestException as e:
-                logger.error(f" API request failed for '{keyword}' page {page}: {e}")
-                break  # Skip this keyword on network errors
+        logger.info(f"Completed keyword '{keyword}': imported {jobs_imported} jobs")
+
+    def _flush_pending(self, pending: List[Dict[str, Any]], store_pool: ThreadPoolExecutor,
+                       store_future):
+        """Embed a buffer of extracted jobs and hand it to the store worker"""
+        if not pending:
+            return store_future
+
+        # All three fields for the whole buffer go through one encode call
+        embeddings_per_job = [{} for _ in pending]
+        if self.embedding_service:
+            try:
+                description_embeddings, title_embeddings, requirements_embeddings = \
+                    self.embedding_service.generate_job_field_embeddings_batch(pending)
+                # float16 keeps cosine ranking intact while halving the
+                # serialized vector size going into the database
+                embeddings_per_job = [
+                    {
+                        'description': description_embeddings[i].astype(np.float16),
+                        'title': title_embeddings[i].astype(np.float16),
+                        'requirements': requirements_embeddings[i].astype(np.float16)
+                    }
+                    for i in range(len(pending))
+                ]
             except Exception as e:
-                logger.error(f" Unexpected error for '{keyword}' page {page}: {e}")
-                break  # Skip this keyword on any other errors
+                logger.warning(f"Failed to generate embeddings for batch: {e}")
+                embeddings_per_job = [{} for _ in pending]
 
-        logger.info(f"Completed keyword '{keyword}': imported {jobs_imported} jobs")
+        # Wait for the previous batch before queueing the next so at most
+        # one store is in flight and its errors surface here
+        if store_future is not None:
+            store_future.result()
+
+        return store_pool.submit(self._store_batch, pending, embeddings_per_job)
+
+    def _store_batch(self, pending: List[Dict[str, Any]],
+                     embeddings_per_job: List[Dict[str, Any]]):
+        """Write one embedded batch to the database"""
+        # One batched insert per flush instead of a round-trip per job
+        try:
+            job_ids = db.store_job_postings_bulk(pending, embeddings_per_job)
+            for job_dict, job_id in zip(pending, job_ids):
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Stored JSearch job: {job_dict['title']} at {job_dict['company']} (ID: {job_id})")
+                self._dedup[job_dict['title'].lower()][job_dict['company'].lower()] = job_id
+                self.stats['successfully_imported'] += 1
+            logger.info(f" Flushed {len(job_ids)} JSearch jobs, first: "
+                        f"{[job['title'] for job in pending[:3]]}")
+            return
+        except Exception as e:
+            logger.error(f" Bulk insert failed, retrying jobs individually: {e}")
+
+        # Fall back to per-job inserts so one bad row doesn't drop the batch
+        for job_dict, embeddings in zip(pending, embeddings_per_job):
+            title, company = job_dict['title'].lower(), job_dict['company'].lower()
+            try:
+                job_id = db.store_job_posting(job_dict, embeddings)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Stored JSearch job: {job_dict['title']} at {job_dict['company']} (ID: {job_id})")
+                self._dedup[title][company] = job_id
+                self.stats['successfully_imported'] += 1
+            except Exception as e:
+                logger.error(f" Error storing job: {e}")
+                self.stats['failed_imports'] += 1
+                # Release the optimistic claim from _process_job so a later
+                # listing for the same pair can still be imported
+                if self._dedup[title].get(company) is None:
+                    self._dedup[title].pop(company, None)
 
     def test_api_connection(self):
         """Test API connection with minimal request"""
@@ -161,7 +474,7 @@ class JSearchJobImporter:
             }
 
             logger.info(f"Testing JSearch API connection...")
-            response = self.session.get(f"{self.base_url}/search", params=params, timeout=30)
+            response = self.session.get(self._search_url, params=params, timeout=30)
 
             logger.info(f"Test response status: {response.status_code}")
 
@@ -184,42 +497,38 @@ class JSearchJobImporter:
             logger.error(f"API test failed: {e}")
             return False
 
-    def _process_job(self, job_data: Dict[str, Any], search_keyword: str) -> bool:
-        """Process and store a single job with better error handling"""
-        try:
-            # Extract job details from JSearch response
-            job_dict = self._extract_job_details(job_data, search_keyword)
-
-            # Check for duplicates (by title + company)
-            if self._is_duplicate_job(job_dict['title'], job_dict['company']):
-                logger.debug(f"Duplicate job: {job_dict['title']} at {job_dict['company']}")
-                return False
-
-            # Generate embeddings if service is available
-            embeddings = {}
-            if self.embedding_service:
-                try:
-                    description_embedding = self.embedding_service.generate_job_embedding(job_dict)
-                    title_embedding = self.embedding_service.model.encode(job_dict['title'])
-                    requirements_embedding = self.embedding_service.model.encode(job_dict.get('requirements', ''))
-
-                    embeddings = {
-                        'description': description_embedding,
-                        'title': title_embedding,
-                        'requirements': requirements_embedding
-                    }
-                except Exception as e:
-                    logger.warning(f"Failed to generate embeddings for job: {e}")
-
-            # Store in database
-            job_id = db.store_job_posting(job_dict, embeddings)
-            logger.info(f" Stored JSearch job: {job_dict['title']} at {job_dict['company']} (ID: {job_id})")
-
-            return True
-
-        except Exception as e:
-            logger.error(f" Error processing job: {e}")
-            return False
+    def _process_job(self, job_data: Dict[str, Any], search_keyword: str) -> Optional[Dict[str, Any]]:
+        """Extract a single job and return it for batched embedding/storage"""
+        # Cheap fingerprint check on the raw payload, before extraction,
+        # skill scanning or embedding spend anything on a repost
+        fingerprint = blake2b(
+            f"{job_data.get('job_title', '')}|{job_data.get('employer_name', '')}|"
+            f"{(job_data.get('job_description') or '')[:512]}".lower().encode(),
+            digest_size=12
+        ).digest()
+        if fingerprint in self._fp_seen:
+            logger.debug(f"Duplicate fingerprint: {job_data.get('job_title')}")
+            return None
+
+        # Dedup on the raw title/company before extraction spends skill
+        # scanning and parsing work on a job that will be dropped anyway;
+        # defaults mirror _extract_job_details
+        title = job_data.get('job_title', '').strip() or 'Unknown Position'
+        company = job_data.get('employer_name', '').strip() or 'Unknown Company'
+        if self._is_duplicate_job(title, company):
+            logger.debug(f"Duplicate job: {title} at {company}")
+            return None
+
+        # Extract job details from JSearch response
+        job_dict = self._extract_job_details(job_data, search_keyword)
+
+        self._fp_seen.add(fingerprint)
+        # Claim the title/company pair now, not at store time, so a second
+        # copy later in the same pending buffer (differing description, so
+        # the fingerprint misses it) is rejected; the id is backfilled when
+        # the batch is stored
+        self._dedup[title.lower()][company.lower()] = None
+        return job_dict
 
     def _extract_job_details(self, job_data: Dict[str, Any], search_keyword: str) -> Dict[str, Any]:
         """Extract and normalize job details from JSearch API response"""
@@ -307,59 +616,42 @@ class JSearchJobImporter:
         """Determine experience level from job title and description"""
         text = (title + ' ' + description).lower()
 
-        if any(word in text for word in ['senior', 'sr.', 'lead', 'principal', 'architect', 'staff']):
+        if _SENIOR_RE.search(text):
             return 'senior'
-        elif any(word in text for word in ['junior', 'jr.', 'entry', 'intern', 'graduate', 'trainee']):
+        elif _ENTRY_RE.search(text):
             return 'entry'
-        elif any(word in text for word in ['manager', 'director', 'head of', 'vp', 'chief']):
+        elif _EXECUTIVE_RE.search(text):
             return 'executive'
         else:
             return 'mid'
 
     def _format_location(self, job_data: Dict) -> str:
         """Format location from JSearch job data"""
-        location_parts = []
-
-        if job_data.get('job_city'):
-            location_parts.append(job_data['job_city'])
-        if job_data.get('job_state'):
-            location_parts.append(job_data['job_state'])
-        if job_data.get('job_country'):
-            location_parts.append(job_data['job_country'])
-
-        return ', '.join(location_parts) if location_parts else ''
+        return ', '.join(part for key in _LOCATION_KEYS if (part := job_data.get(key)))
 
     def _normalize_job_type(self, employment_type: str) -> str:
         """Normalize job type from JSearch format"""
-        type_mapping = {
-            'FULLTIME': 'full-time',
-            'PARTTIME': 'part-time',
-            'CONTRACTOR': 'contract',
-            'INTERN': 'internship'
-        }
-        return type_mapping.get(employment_type.upper(), 'full-time')
+        return _JOB_TYPE_MAP.get(employment_type.upper(), 'full-time')
 
     def _is_remote_job(self, description: str) -> bool:
         """Check if job allows remote work"""
         if not description:
             return False
 
-        remote_keywords = ['remote', 'work from home', 'wfh', 'distributed', 'telecommute', 'virtual']
-        description_lower = description.lower()
-        return any(keyword in description_lower for keyword in remote_keywords)
+        return _REMOTE_RE.search(description.lower()) is not None
 
     def _extract_skills_from_description(self, description: str) -> List[str]:
         """Extract technical skills from job description using shared skill taxonomy."""
-        from api import extract_skills_for_jobs
-        return extract_skills_for_jobs(description, max_skills=20)
+        if not description:
+            return []
+
+        desc_hash = blake2b(description.encode('utf-8', 'ignore'), digest_size=16).digest()
+        return list(_cached_skill_extract(desc_hash, description))
 
     def _is_duplicate_job(self, title: str, company: str) -> bool:
-        """Check if job already exists in database"""
-        try:
-            existing_jobs = db.get_jobs_by_title_company(title, company)
-            return len(existing_jobs) > 0
-        except:
-            return False
+        """Check if job already exists via the in-memory title/company index"""
+        companies = self._dedup.get(title.lower())
+        return companies is not None and company.lower() in companies
 
     def get_import_summary(self) -> Dict[str, Any]:
         """Get summary of import statistics"""
@@ -0,0 +1,232 @@
+"""
+Hot text-scanning helpers for the Muse job importer.
+
+These are pure, fully type-annotated module-level functions (no self, no
+closures) so the whole module can be compiled with mypyc or Cython as a
+drop-in build step without any logic changes.
+"""
+import re
+from typing import Dict, List, Optional, Tuple
+
+from lxml import html as lxml_html
+
+EDUCATION_TERMS: List[str] = [
+    "bachelor's degree", "master's degree", "phd", "doctorate",
+    "computer science", "engineering", "mathematics", "statistics",
+    "degree in", "bs in", "ms in", "ba in", "ma in"
+]
+
+# Captures the sentence surrounding the first education term in one scan,
+# replacing the per-term split('.')-and-rescan loop
+EDU_SENTENCE_RE = re.compile(
+    r"[^.]{0,200}\b(?:" + "|".join(re.escape(term) for term in EDUCATION_TERMS) + r")\b[^.]{0,200}",
+    re.IGNORECASE
+)
+
+# Section extraction patterns, compiled once instead of per job
+REQUIREMENTS_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE | re.DOTALL) for pattern in [
+        r'requirements?:?\s*(.*?)(?=responsibilities?:|qualifications?:|experience?:|$)',
+        r'qualifications?:?\s*(.*?)(?=responsibilities?:|requirements?:|experience?:|$)',
+        r'you have:?\s*(.*?)(?=responsibilities?:|requirements?:|we offer:|$)'
+    ]
+]
+
+RESPONSIBILITIES_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE | re.DOTALL) for pattern in [
+        r'responsibilities?:?\s*(.*?)(?=requirements?:|qualifications?:|benefits?:|$)',
+        r'you will:?\s*(.*?)(?=requirements?:|qualifications?:|benefits?:|$)',
+        r'role:?\s*(.*?)(?=requirements?:|qualifications?:|benefits?:|$)'
+    ]
+]
+
+SENIOR_TERMS: List[str] = ['senior', 'lead', 'principal', 'staff', 'architect',
+                           '5+ years', '6+ years', '7+ years', '8+ years', '10+ years',
+                           'leadership', 'mentor', 'team lead']
+
+ENTRY_TERMS: List[str] = ['junior', 'entry', 'graduate', 'intern', 'new grad',
+                          '0-2 years', '1-2 years', 'recent graduate', 'bootcamp']
+
+CONTRACT_TERMS: List[str] = ['contract', 'contractor', 'freelance', 'consulting']
+PART_TIME_TERMS: List[str] = ['part-time', 'part time', 'parttime']
+INTERNSHIP_TERMS: List[str] = ['intern', 'internship']
+
+HTML_TAG_RE = re.compile(r'<[^<]+?>')
+
+
+def _term_scanner(terms: List[str]) -> 're.Pattern[str]':
+    """
+    Compile a term list into one longest-first alternation so a whole set of
+    needles is found in a single linear scan instead of one substring search
+    per term (an automaton-style multi-pattern match using the C regex engine).
+    """
+    ordered = sorted(terms, key=len, reverse=True)
+    return re.compile("|".join(re.escape(term) for term in ordered))
+
+
+CONTRACT_RE = _term_scanner(CONTRACT_TERMS)
+PART_TIME_RE = _term_scanner(PART_TIME_TERMS)
+INTERNSHIP_RE = _term_scanner(INTERNSHIP_TERMS)
+
+_CLASSIFIER_BUCKETS: Dict[str, List[str]] = {
+    'senior': SENIOR_TERMS,
+    'entry': ENTRY_TERMS,
+    'contract': CONTRACT_TERMS,
+    'part_time': PART_TIME_TERMS,
+    'internship': INTERNSHIP_TERMS,
+}
+
+
+def _build_term_buckets() -> Dict[str, Tuple[str, ...]]:
+    """Map every classifier term to the buckets it scores for."""
+    buckets: Dict[str, set] = {}
+    for bucket, terms in _CLASSIFIER_BUCKETS.items():
+        for term in terms:
+            buckets.setdefault(term, set()).add(bucket)
+    return {term: tuple(sorted(term_buckets)) for term, term_buckets in buckets.items()}
+
+
+TERM_BUCKETS = _build_term_buckets()
+
+# Zero-width lookahead so the single scan reports a term at every position
+# even when matches overlap; longest-first ordering makes the captured term
+# the longest one starting there.
+FUSED_CLASSIFIER_RE = re.compile("(?=(" + "|".join(
+    re.escape(term) for term in sorted(TERM_BUCKETS, key=len, reverse=True)) + "))")
+
+# A match on a longer term proves every shorter term it contains is present
+# too (e.g. 'internship' implies the entry-level term 'intern')
+TERM_IMPLIED: Dict[str, frozenset] = {
+    term: frozenset(other for other in TERM_BUCKETS if other != term and other in term)
+    for term in TERM_BUCKETS
+}
+
+
+def _matched_terms(desc_lower: str) -> set:
+    """Collect the distinct classifier terms present in the text in one scan."""
+    seen: set = set()
+    for match in FUSED_CLASSIFIER_RE.finditer(desc_lower):
+        term = match.group(1)
+        if term not in seen:
+            seen.add(term)
+            seen.update(TERM_IMPLIED[term])
+    return seen
+
+
+def clean_html(text: str) -> str:
+    """Remove HTML tags and clean text"""
+    if not text:
+        return ''
+
+    try:
+        # lxml parses the markup in a single C-level pass, which is much
+        # faster than regex-stripping and immune to backtracking on
+        # malformed HTML
+        clean_text = lxml_html.fromstring(text).text_content()
+    except Exception:
+        # Fall back to regex stripping for fragments lxml can't parse
+        clean_text = HTML_TAG_RE.sub('', text)
+
+    # Normalize whitespace (str.split/join run at C level)
+    return ' '.join(clean_text.split())
+
+
+def classify_description(description: str, desc_lower: Optional[str] = None) -> Tuple[str, str]:
+    """
+    Score the job-type and experience-level classifiers in one fused pass
+    over the description instead of re-reading the same bytes per bucket.
+
+    Returns:
+        (job_type, experience_level)
+    """
+    if desc_lower is None:
+        desc_lower = description.lower()
+
+    # Count distinct terms per bucket (not raw occurrences), matching the
+    # original one-membership-test-per-term semantics
+    counts = {'senior': 0, 'entry': 0, 'contract': 0, 'part_time': 0, 'internship': 0}
+    for term in _matched_terms(desc_lower):
+        for bucket in TERM_BUCKETS[term]:
+            counts[bucket] += 1
+
+    if counts['contract']:
+        job_type = 'contract'
+    elif counts['part_time']:
+        job_type = 'part-time'
+    elif counts['internship']:
+        job_type = 'internship'
+    else:
+        job_type = 'full-time'
+
+    if counts['senior'] > counts['entry'] and counts['senior'] > 0:
+        experience_level = 'senior'
+    elif counts['entry'] > 0:
+        experience_level = 'entry'
+    else:
+        experience_level = 'mid'
+
+    return job_type, experience_level
+
+
+def determine_experience_level(description: str, desc_lower: Optional[str] = None) -> str:
+    """Determine experience level from job description"""
+    if desc_lower is None:
+        desc_lower = description.lower()
+
+    # Count distinct terms present, in one fused scan
+    seen = _matched_terms(desc_lower)
+    senior_count = sum(1 for term in SENIOR_TERMS if term in seen)
+    entry_count = sum(1 for term in ENTRY_TERMS if term in seen)
+
+    if senior_count > entry_count and senior_count > 0:
+        return 'senior'
+    elif entry_count > 0:
+        return 'entry'
+    else:
+        return 'mid'
+
+
+def determine_job_type(description: str, desc_lower: Optional[str] = None) -> str:
+    """Determine job type from description"""
+    if desc_lower is None:
+        desc_lower = description.lower()
+
+    if CONTRACT_RE.search(desc_lower):
+        return 'contract'
+    elif PART_TIME_RE.search(desc_lower):
+        return 'part-time'
+    elif INTERNSHIP_RE.search(desc_lower):
+        return 'internship'
+    else:
+        return 'full-time'
+
+
+def extract_requirements(description: str) -> str:
+    """Extract requirements section from job description"""
+    # Look for common requirements section headers
+    for pattern in REQUIREMENTS_PATTERNS:
+        match = pattern.search(description)
+        if match:
+            requirements = match.group(1).strip()
+            if len(requirements) > 50:  # Only return if substantial
+                return requirements[:500]  # Limit length
+
+    return ''
+
+
+def extract_responsibilities(description: str) -> str:
+    """Extract responsibilities section from job description"""
+    for pattern in RESPONSIBILITIES_PATTERNS:
+        match = pattern.search(description)
+        if match:
+            responsibilities = match.group(1).strip()
+            if len(responsibilities) > 50:
+                return responsibilities[:500]
+
+    return ''
+
+
+def extract_education_requirements(description: str) -> str:
+    """Extract education requirements from job description"""
+    match = EDU_SENTENCE_RE.search(description)
+    return match.group(0).strip()[:200] if match else ''
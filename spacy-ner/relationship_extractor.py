@@ -1,6 +1,15 @@
+import heapq
+import os
 import re
-from typing import Dict, List, Tuple, Optional, Set, Any
-from dataclasses import dataclass
+import sys
+from functools import lru_cache
+from hashlib import blake2b
+from itertools import islice
+from operator import itemgetter
+import numpy as np
+from collections import defaultdict
+from typing import Dict, Iterable, Iterator, List, Tuple, Optional, Set, Any
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 import spacy
 from spacy.matcher import Matcher
@@ -11,46 +20,102 @@ STANDARD_SECTION_HEADERS = [
     r"summary", r"professional\s+summary", r"objective", r"career\s+summary",
 ]
 NON_STANDARD_HEADER_HINTS = ["journey", "story", "about me", "my background", "where i've", "life so far"]
+STANDARD_SECTION_HEADER_RE = re.compile("|".join(f"(?:{p})" for p in STANDARD_SECTION_HEADERS))
+# Section anchor words whose first occurrence the ATS engine needs; none
+# is a substring of another, so one pass finds them all
+SECTION_ANCHOR_RE = re.compile(r"experience|education|skills|summary|objective")
+NONSTD_HINT_RE = re.compile("|".join(re.escape(h) for h in NON_STANDARD_HEADER_HINTS))
+SCHOOL_KEYWORD_RE = re.compile(r"university|college|institute|school")
 DATE_YEAR = re.compile(r"\b(19|20)\d{2}\b")
 DATE_MONTH_YEAR = re.compile(
     r"(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s*(\.?\s*)?\d{4}",
     re.IGNORECASE,
 )
 
+# Hot-path patterns compiled once at import so per-resume calls skip the
+# re module's internal cache lookup and pattern parsing
+GPA_RE = re.compile(r'\bgpa\s*:?\s*(\d+\.?\d*)\b', re.IGNORECASE)
+# The three achievement shapes fused into one alternation so the resume
+# is traversed once instead of once per pattern
+ACHIEVEMENT_RE = re.compile(
+    r'(?:achieved|accomplished|delivered|increased|decreased|improved|reduced|built|created|developed|led|managed)\s+[^.!?]*(?:\d+%|\$\d+|by \d+)'
+    r'|(?:winner|recipient|awarded|recognized)\s+[^.!?]*'
+    r'|(?:successfully|effectively)\s+(?:led|managed|delivered|implemented)\s+[^.!?]*',
+    re.IGNORECASE
+)
+EMAIL_RE = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b")
+SLASH_OR_YEAR_RE = re.compile(r"\b\d{1,2}/\d{4}\b|\b\d{4}\b")
+SPECIAL_CHAR_RE = re.compile(r"[^\w\s\-.,()@\n]")
+BLANK_LINES_RE = re.compile(r"\n\s*\n\s*\n")
+QUANTIFIED_ACHIEVEMENT_RE = re.compile(r'\d+[%$]|\d+\s*(?:years?|months?)')
+
+# Seniority indicators in job titles; dict order doubles as match priority
+SENIORITY_SCORES = {
+    "intern": 1, "junior": 2, "associate": 3, "mid": 4, "senior": 5,
+    "staff": 6, "principal": 7, "lead": 8, "manager": 9, "director": 10, "vp": 11
+}
+SENIORITY_RE = re.compile(r'\b(' + '|'.join(SENIORITY_SCORES) + r')\b')
+
+# Proficiency indicators near a skill mention; dict order doubles as
+# match priority, mirrored by the fused named-group pattern below
+PROFICIENCY_LEVELS = {
+    "Expert": ["expert", "advanced", "senior level", "10+ years", "5+ years"],
+    "Proficient": ["proficient", "experienced", "strong", "solid", "3+ years"],
+    "Intermediate": ["intermediate", "familiar", "working knowledge", "1+ years"],
+    "Beginner": ["beginner", "basic", "learning", "exposure", "familiar with"]
+}
+PROFICIENCY_RE = re.compile("|".join(
+    f"(?P<{level}>" + "|".join(re.escape(ind) for ind in indicators) + ")"
+    for level, indicators in PROFICIENCY_LEVELS.items()
+))
+
+# One compiled Matcher per spaCy vocab, shared across extractor instances.
+# Keyed on the Vocab object itself (not its id()) so the cache keeps the
+# vocab alive and a recycled id() can never hand out a Matcher compiled
+# against a freed vocab.
+_MATCHER_CACHE: Dict[Any, Matcher] = {}
+
+# Memoized ATS results for the inferred-context scoring path
+_ATS_CACHE: Dict[Tuple[bytes, bytes, Tuple[str, ...]], Dict[str, Any]] = {}
+_ATS_CACHE_SIZE = 256
+
+# __slots__ is written out by hand (dataclass(slots=True) needs 3.10, the
+# service runtime is pinned to 3.9), which also rules out field defaults —
+# a class-level default would conflict with its slot — so construction
+# sites pass every field explicitly
+
 @dataclass
 class WorkExperience:
+    __slots__ = ('title', 'company', 'start_date', 'end_date', 'duration',
+                 'skills', 'achievements', 'location')
     title: str
     company: str
-    start_date: Optional[str] = None
-    end_date: Optional[str] = None
-    duration: Optional[str] = None
-    skills: List[str] = None
-    achievements: List[str] = None
-    location: Optional[str] = None
-
-    def __post_init__(self):
-        if self.skills is None:
-            self.skills = []
-        if self.achievements is None:
-            self.achievements = []
+    start_date: Optional[str]
+    end_date: Optional[str]
+    duration: Optional[str]
+    skills: List[str]
+    achievements: List[str]
+    location: Optional[str]
 
 
 @dataclass
 class EducationRecord:
+    __slots__ = ('degree', 'field', 'school', 'year', 'gpa', 'location')
     degree: str
-    field: Optional[str] = None
-    school: str = None
-    year: Optional[str] = None
-    gpa: Optional[str] = None
-    location: Optional[str] = None
+    field: Optional[str]
+    school: Optional[str]
+    year: Optional[str]
+    gpa: Optional[str]
+    location: Optional[str]
 
 
 @dataclass
 class SkillGroup:
+    __slots__ = ('category', 'skills', 'proficiency', 'years_experience')
     category: str
     skills: List[str]
-    proficiency: Optional[str] = None
-    years_experience: Optional[int] = None
+    proficiency: Optional[str]
+    years_experience: Optional[int]
 
 
 class IntelligentRelationshipExtractor:
@@ -60,8 +125,18 @@ class IntelligentRelationshipExtractor:
 
     def __init__(self, nlp_model):
         self.nlp = nlp_model
-        self.matcher = Matcher(nlp_model.vocab)
-        self._setup_patterns()
+        # Reuse one compiled Matcher per vocab; pattern compilation is not
+        # free and every extractor instance uses the same pattern set
+        self.matcher = _MATCHER_CACHE.get(nlp_model.vocab)
+        if self.matcher is None:
+            self.matcher = Matcher(nlp_model.vocab)
+            self._setup_patterns()
+            _MATCHER_CACHE[nlp_model.vocab] = self.matcher
+
+        # Only tokenization and entities are consumed downstream; cache the
+        # list of everything else so each parse can disable it up front
+        self._needed_disables = [name for name in nlp_model.pipe_names
+                                 if name not in {"tok2vec", "ner"}]
 
         # Skill categories for intelligent grouping
         self.skill_categories = {
@@ -89,6 +164,27 @@ class IntelligentRelationshipExtractor:
                 "git", "jira", "confluence", "slack", "figma", "photoshop", "linux"
             ]
         }
+        # Frozen sets give hash-based exact-membership checks during
+        # categorization instead of linear list scans
+        self.skill_categories = {category: frozenset(skills)
+                                 for category, skills in self.skill_categories.items()}
+
+        # Every category skill fused into one longest-first alternation so a
+        # context window is scanned once at C level instead of once per skill.
+        # Canonical names are interned so dedup sets and dict lookups over
+        # them compare by pointer.
+        self._skill_lookup = {
+            sys.intern(skill): (category, sys.intern(skill.title()))
+            for category, skills in self.skill_categories.items()
+            for skill in skills
+        }
+        self._skill_scan_re = re.compile(
+            "|".join(re.escape(skill)
+                     for skill in sorted(self._skill_lookup, key=len, reverse=True))
+        )
+        # Memoizes _classify_skill; the same tokens ("python", "react",
+        # "docker") recur across work-experience blocks and resumes
+        self._skill_class_cache = {}
 
     def _setup_patterns(self):
         """Setup spaCy patterns for relationship extraction"""
@@ -132,129 +228,225 @@ class IntelligentRelationshipExtractor:
         self.matcher.add("DATE_RANGE", date_range_patterns)
         self.matcher.add("EDUCATION", education_patterns)
 
-    def extract_relationships(self, text: str, entities: List[Dict]) -> Dict:
+    def extract_relationships(self, text: str, entities: List[Dict], doc=None) -> Dict:
         """
         Extract relationships between entities and build structured data
+
+        A pre-parsed Doc can be passed to skip re-running the pipeline.
         """
-        doc = self.nlp(text)
+        if doc is None:
+            # Skip the tagger/parser/lemmatizer components cached at init.
+            # nlp.pipe builds its component chain locally from `disable`,
+            # unlike select_pipes which mutates the shared pipeline — other
+            # threads parsing through the same module-global nlp during
+            # that window would silently lose their NER annotations
+            doc = next(self.nlp.pipe([text], disable=self._needed_disables))
 
         # Find pattern matches
         matches = self.matcher(doc)
 
+        # One lowercase pass shared by every helper that scans the text
+        text_lower = text.lower()
+
+        # Bucket entities by label once so the extractors below pull from
+        # the buckets instead of each re-scanning the full entity list
+        by_label = self._bucket_by_label(entities)
+
         # Extract structured data
-        work_experience = self._extract_work_experience(text, entities, doc)
-        education = self._extract_education(text, entities, doc)
-        skills = self._extract_and_categorize_skills(text, entities)
+        work_experience = self._extract_work_experience(text, entities, doc, text_lower=text_lower,
+                                                        by_label=by_label)
+        education = self._extract_education(text, entities, doc, by_label=by_label)
+        skills = self._extract_and_categorize_skills(text, entities, text_lower=text_lower,
+                                                     by_label=by_label)
 
         # Extract achievements and responsibilities
         achievements = self._extract_achievements(text, doc)
 
+        # Lowercase titles/companies once; the analytics passes below each
+        # used to re-lower the same strings
+        titles_lc = [exp.title.lower() if exp.title else "" for exp in work_experience]
+        companies_lc = [exp.company.lower() if exp.company else "" for exp in work_experience]
+
         # Calculate experience metrics
-        experience_metrics = self._calculate_experience_metrics(work_experience)
+        experience_metrics = self._calculate_experience_metrics(work_experience, titles_lc, companies_lc)
 
         return {
-            "work_experience": [self._work_exp_to_dict(exp) for exp in work_experience],
-            "education": [self._education_to_dict(edu) for edu in education],
+            "work_experience": [asdict(exp) for exp in work_experience],
+            "education": [asdict(edu) for edu in education],
             "skills": skills,
             "achievements": achievements,
             "experience_metrics": experience_metrics,
-            "career_progression": self._analyze_career_progression(work_experience),
+            "career_progression": self._analyze_career_progression(work_experience, titles_lc),
             "skill_evolution": self._analyze_skill_evolution(work_experience)
         }
 
-    def _extract_work_experience(self, text: str, entities: List[Dict], doc) -> List[WorkExperience]:
+    def extract_relationships_batch(self, texts: Iterable[str],
+                                    entities_list: Iterable[List[Dict]],
+                                    batch_size: Optional[int] = None,
+                                    n_process: Optional[int] = None) -> Iterator[Dict]:
+        """
+        Extract relationships for many resumes at once, parsing them
+        through nlp.pipe so tokenization and NER run batched rather than
+        one pipeline invocation per text.
+
+        Batch size and worker count default to the LANDIT_SPACY_BATCH and
+        LANDIT_SPACY_PROCS environment variables so deployments can tune
+        them without code changes.
+        """
+        if batch_size is None:
+            batch_size = int(os.getenv("LANDIT_SPACY_BATCH", "50"))
+        if n_process is None:
+            n_process = int(os.getenv("LANDIT_SPACY_PROCS", "1"))
+        texts = list(texts)
+        docs = self.nlp.pipe(texts, batch_size=batch_size, n_process=n_process,
+                             disable=self._needed_disables)
+        for text, doc, entities in zip(texts, docs, entities_list):
+            yield self.extract_relationships(text, entities, doc=doc)
+
+    @staticmethod
+    def _bucket_by_label(entities: List[Dict]) -> Dict[str, List[Dict]]:
+        """Group entities by label in a single pass, preserving text order."""
+        by_label = defaultdict(list)
+        for entity in entities:
+            by_label[entity["label"]].append(entity)
+        return by_label
+
+    @staticmethod
+    def _entities_with_labels(by_label: Dict[str, List[Dict]], *labels: str) -> List[Dict]:
+        """Merge label buckets back into text order."""
+        selected = [e for label in labels for e in by_label.get(label, ())]
+        if len(labels) > 1:
+            selected.sort(key=lambda e: e["start"])
+        return selected
+
+    def _extract_work_experience(self, text: str, entities: List[Dict], doc,
+                                 text_lower: Optional[str] = None,
+                                 by_label: Optional[Dict[str, List[Dict]]] = None) -> List[WorkExperience]:
         """Extract structured work experience"""
         work_experiences = []
 
+        if text_lower is None:
+            text_lower = text.lower()
+        if by_label is None:
+            by_label = self._bucket_by_label(entities)
+
         # Find job titles and companies
-        titles = [e for e in entities if e["label"] in ["TITLE", "JOB"]]
-        companies = [e for e in entities if e["label"] in ["COMPANY", "ORG"]]
-        dates = [e for e in entities if e["label"] in ["DATE", "DURATION"]]
+        titles = self._entities_with_labels(by_label, "TITLE", "JOB")
+        companies = self._entities_with_labels(by_label, "COMPANY", "ORG")
+        dates = self._entities_with_labels(by_label, "DATE", "DURATION")
+
+        # Midpoints are computed once per candidate list and fused into a
+        # single array so each title pays for one |mid - target| pass that
+        # answers both the closest-company and nearby-dates queries
+        companies_mid = self._entity_midpoints(companies)
+        dates_mid = self._entity_midpoints(dates)
+        combined_mid = np.concatenate((companies_mid, dates_mid))
+        n_companies = len(companies)
 
         # Group by proximity (entities close to each other likely belong together)
         for title in titles:
+            target_mid = (title["start"] + title["end"]) / 2
+            combined_dist = np.abs(combined_mid - target_mid)
+
             # Find closest company
-            closest_company = self._find_closest_entity(title, companies, max_distance=200)
+            closest_company = self._find_closest_entity(title, companies,
+                                                        distances=combined_dist[:n_companies],
+                                                        max_distance=200)
 
             # Find associated dates
-            associated_dates = self._find_nearby_entities(title, dates, max_distance=300)
+            associated_dates = self._find_nearby_entities(title, dates,
+                                                          distances=combined_dist[n_companies:],
+                                                          max_distance=300)
 
             # Extract skills mentioned near this job
-            job_skills = self._extract_contextual_skills(text, title["start"], title["end"])
+            job_skills = self._extract_contextual_skills(text, title["start"], title["end"],
+                                                         text_lower=text_lower)
 
             if closest_company:
                 work_exp = WorkExperience(
                     title=title["text"],
                     company=closest_company["text"],
-                    skills=job_skills,
                     start_date=associated_dates[0]["text"] if len(associated_dates) > 0 else None,
-                    end_date=associated_dates[1]["text"] if len(associated_dates) > 1 else None
+                    end_date=associated_dates[1]["text"] if len(associated_dates) > 1 else None,
+                    duration=None,
+                    skills=job_skills,
+                    achievements=[],
+                    location=None
                 )
                 work_experiences.append(work_exp)
 
         return work_experiences
 
-    def _extract_education(self, text: str, entities: List[Dict], doc) -> List[EducationRecord]:
+    def _extract_education(self, text: str, entities: List[Dict], doc,
+                           by_label: Optional[Dict[str, List[Dict]]] = None) -> List[EducationRecord]:
         """Extract structured education records"""
         education_records = []
 
-        degrees = [e for e in entities if e["label"] in ["EDUCATION", "DEGREE"]]
-        schools = [e for e in entities if e["label"] in ["ORG", "EDUCATION"]
-                   and any(keyword in e["text"].lower()
-                           for keyword in ["university", "college", "institute", "school"])]
+        if by_label is None:
+            by_label = self._bucket_by_label(entities)
+
+        degrees = self._entities_with_labels(by_label, "EDUCATION", "DEGREE")
+        schools = [e for e in self._entities_with_labels(by_label, "ORG", "EDUCATION")
+                   if SCHOOL_KEYWORD_RE.search(e["text"].lower())]
+
+        schools_mid = self._entity_midpoints(schools)
 
         for degree in degrees:
-            closest_school = self._find_closest_entity(degree, schools, max_distance=300)
+            closest_school = self._find_closest_entity(degree, schools, midpoints=schools_mid,
+                                                       max_distance=300)
 
             # Extract year
-            year_match = re.search(r'\b(19|20)\d{2}\b', text[max(0, degree["start"] - 100):degree["end"] + 100])
+            year_match = DATE_YEAR.search(text[max(0, degree["start"] - 100):degree["end"] + 100])
             year = year_match.group() if year_match else None
 
             # Extract GPA
-            gpa_match = re.search(r'\bgpa\s*:?\s*(\d+\.?\d*)\b',
-                                  text[max(0, degree["start"] - 50):degree["end"] + 50], re.IGNORECASE)
+            gpa_match = GPA_RE.search(text[max(0, degree["start"] - 50):degree["end"] + 50])
             gpa = gpa_match.group(1) if gpa_match else None
 
             education_record = EducationRecord(
                 degree=degree["text"],
+                field=None,
                 school=closest_school["text"] if closest_school else None,
                 year=year,
-                gpa=gpa
+                gpa=gpa,
+                location=None
             )
             education_records.append(education_record)
 
         return education_records
 
-    def _extract_and_categorize_skills(self, text: str, entities: List[Dict]) -> Dict[str, List[Dict]]:
+    def _extract_and_categorize_skills(self, text: str, entities: List[Dict],
+                                       text_lower: Optional[str] = None,
+                                       by_label: Optional[Dict[str, List[Dict]]] = None) -> Dict[str, List[Dict]]:
         """Extract and intelligently categorize skills"""
-        skill_entities = [e for e in entities if e["label"] in ["SKILL", "TECHNOLOGY", "TOOL"]]
+        if by_label is None:
+            by_label = self._bucket_by_label(entities)
+        skill_entities = self._entities_with_labels(by_label, "SKILL", "TECHNOLOGY", "TOOL")
+
+        if text_lower is None:
+            text_lower = text.lower()
 
         categorized_skills = {}
         uncategorized_skills = []
 
         for skill_entity in skill_entities:
-            skill_name = skill_entity["text"].lower().strip()
-            category_found = False
-
-            # Try to categorize the skill
-            for category, category_skills in self.skill_categories.items():
-                if any(cat_skill in skill_name or skill_name in cat_skill
-                       for cat_skill in category_skills):
-                    if category not in categorized_skills:
-                        categorized_skills[category] = []
-
-                    # Try to extract proficiency level
-                    proficiency = self._extract_skill_proficiency(text, skill_entity)
-
-                    categorized_skills[category].append({
-                        "name": skill_entity["text"],
-                        "proficiency": proficiency,
-                        "confidence": skill_entity.get("confidence", 0.8)
-                    })
-                    category_found = True
-                    break
+            skill_name = sys.intern(skill_entity["text"].lower().strip())
+            category = self._classify_skill(skill_name)
 
-            if not category_found:
+            if category is not None:
+                if category not in categorized_skills:
+                    categorized_skills[category] = []
+
+                # Try to extract proficiency level
+                proficiency = self._extract_skill_proficiency(text, skill_entity,
+                                                              text_lower=text_lower)
+
+                categorized_skills[category].append({
+                    "name": skill_entity["text"],
+                    "proficiency": proficiency,
+                    "confidence": skill_entity.get("confidence", 0.8)
+                })
+            else:
                 uncategorized_skills.append({
                     "name": skill_entity["text"],
                     "proficiency": None,
@@ -266,58 +458,90 @@ class IntelligentRelationshipExtractor:
 
         return categorized_skills
 
-    def _extract_skill_proficiency(self, text: str, skill_entity: Dict) -> Optional[str]:
+    def _classify_skill(self, skill_name: str) -> Optional[str]:
+        """Resolve a lowercased skill name to its category, memoized so the
+        substring fallback runs once per distinct token"""
+        if skill_name in self._skill_class_cache:
+            return self._skill_class_cache[skill_name]
+
+        # Exact lookup first; the fallbacks only run on a miss
+        hit = self._skill_lookup.get(skill_name)
+        category = hit[0] if hit else None
+        if category is None:
+            # One pass of the fused alternation finds any canonical skill
+            # embedded in the entity text, replacing the per-category
+            # nested containment loop
+            scan = self._skill_scan_re.search(skill_name)
+            if scan:
+                category = self._skill_lookup[scan.group(0)][0]
+        if category is None:
+            # Last resort: the entity text is a fragment of a canonical
+            # skill ("postgre" -> postgresql)
+            for candidate, category_skills in self.skill_categories.items():
+                if any(skill_name in cat_skill for cat_skill in category_skills):
+                    category = candidate
+                    break
+
+        if len(self._skill_class_cache) >= 4096:
+            # Drop the oldest entry (dicts preserve insertion order)
+            self._skill_class_cache.pop(next(iter(self._skill_class_cache)))
+        self._skill_class_cache[skill_name] = category
+        return category
+
+    def _extract_skill_proficiency(self, text: str, skill_entity: Dict,
+                                   text_lower: Optional[str] = None) -> Optional[str]:
         """Try to extract proficiency level for a skill"""
-        # Look for proficiency indicators near the skill
-        context = text[max(0, skill_entity["start"] - 50):skill_entity["end"] + 50].lower()
-
-        proficiency_patterns = {
-            "Expert": ["expert", "advanced", "senior level", "10+ years", "5+ years"],
-            "Proficient": ["proficient", "experienced", "strong", "solid", "3+ years"],
-            "Intermediate": ["intermediate", "familiar", "working knowledge", "1+ years"],
-            "Beginner": ["beginner", "basic", "learning", "exposure", "familiar with"]
-        }
+        if text_lower is None:
+            text_lower = text.lower()
+
+        # Look for proficiency indicators near the skill: one pass of the
+        # fused pattern, then highest-priority level found wins
+        context = text_lower[max(0, skill_entity["start"] - 50):skill_entity["end"] + 50]
 
-        for level, indicators in proficiency_patterns.items():
-            if any(indicator in context for indicator in indicators):
-                return level
+        found = {m.lastgroup for m in PROFICIENCY_RE.finditer(context)}
+        if found:
+            for level in PROFICIENCY_LEVELS:
+                if level in found:
+                    return level
 
         return None
 
     def _extract_achievements(self, text: str, doc) -> List[str]:
         """Extract achievements and accomplishments using NLP patterns"""
         achievements = []
+        seen = set()
+
+        for match in ACHIEVEMENT_RE.finditer(text):
+            achievement = match.group().strip()
+            if len(achievement) > 20 and achievement not in seen:
+                seen.add(achievement)
+                achievements.append(achievement)
+                if len(achievements) >= 10:  # Limit to top 10
+                    break
 
-        # Achievement indicator patterns
-        achievement_patterns = [
-            r'(?:achieved|accomplished|delivered|increased|decreased|improved|reduced|built|created|developed|led|managed)\s+[^.!?]*(?:\d+%|\$\d+|by \d+)',
-            r'(?:winner|recipient|awarded|recognized)\s+[^.!?]*',
-            r'(?:successfully|effectively)\s+(?:led|managed|delivered|implemented)\s+[^.!?]*'
-        ]
-
-        for pattern in achievement_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                achievement = match.group().strip()
-                if len(achievement) > 20 and achievement not in achievements:
-                    achievements.append(achievement)
-
-        return achievements[:10]  # Limit to top 10
+        return achievements
 
-    def _calculate_experience_metrics(self, work_experiences: List[WorkExperience]) -> Dict:
+    def _calculate_experience_metrics(self, work_experiences: List[WorkExperience],
+                                      titles_lc: Optional[List[str]] = None,
+                                      companies_lc: Optional[List[str]] = None) -> Dict:
         """Calculate experience-related metrics"""
         if not work_experiences:
             return {"total_years": 0, "companies": 0, "roles": 0, "average_tenure": 0}
 
+        if titles_lc is None:
+            titles_lc = [exp.title.lower() if exp.title else "" for exp in work_experiences]
+        if companies_lc is None:
+            companies_lc = [exp.company.lower() if exp.company else "" for exp in work_experiences]
+
         total_years = 0
         companies = set()
         roles = set()
 
-        for exp in work_experiences:
-            if exp.company:
-                companies.add(exp.company.lower())
-            if exp.title:
-                roles.add(exp.title.lower())
+        for exp, title_lc, company_lc in zip(work_experiences, titles_lc, companies_lc):
+            if company_lc:
+                companies.add(company_lc)
+            if title_lc:
+                roles.add(title_lc)
 
             # Try to calculate duration
             if exp.start_date and exp.end_date:
@@ -343,26 +567,26 @@ class IntelligentRelationshipExtractor:
             "average_tenure": average_tenure
         }
 
-    def _analyze_career_progression(self, work_experiences: List[WorkExperience]) -> Dict:
+    def _analyze_career_progression(self, work_experiences: List[WorkExperience],
+                                    titles_lc: Optional[List[str]] = None) -> Dict:
         """Analyze career progression patterns"""
         if len(work_experiences) < 2:
             return {"progression_score": 0, "trend": "insufficient_data"}
 
-        # Seniority indicators in job titles
-        seniority_levels = {
-            "intern": 1, "junior": 2, "associate": 3, "mid": 4, "senior": 5,
-            "staff": 6, "principal": 7, "lead": 8, "manager": 9, "director": 10, "vp": 11
-        }
+        if titles_lc is None:
+            titles_lc = [exp.title.lower() if exp.title else "" for exp in work_experiences]
 
         progression_scores = []
-        for exp in work_experiences:
-            title_lower = exp.title.lower()
+        for title_lower in titles_lc:
             score = 4  # Default mid-level
 
-            for level, level_score in seniority_levels.items():
-                if level in title_lower:
-                    score = level_score
-                    break
+            # One scan collects every indicator; priority order still decides
+            found = {m.group(1) for m in SENIORITY_RE.finditer(title_lower)}
+            if found:
+                for level, level_score in SENIORITY_SCORES.items():
+                    if level in found:
+                        score = level_score
+                        break
 
             progression_scores.append(score)
 
@@ -387,134 +611,142 @@ class IntelligentRelationshipExtractor:
 
     def _analyze_skill_evolution(self, work_experiences: List[WorkExperience]) -> Dict:
         """Analyze how skills evolved across jobs"""
-        skill_timeline = {}
-        all_skills = set()
+        # One pass: per-skill count and first/last job index tracked
+        # incrementally instead of re-scanning appearance lists afterwards
+        skill_timeline = defaultdict(lambda: {"count": 0, "min_idx": 0, "max_idx": 0})
 
         for i, exp in enumerate(work_experiences):
             for skill in exp.skills:
-                skill_lower = skill.lower()
-                all_skills.add(skill_lower)
-
-                if skill_lower not in skill_timeline:
-                    skill_timeline[skill_lower] = []
-
-                skill_timeline[skill_lower].append({
-                    "job_index": i,
-                    "company": exp.company,
-                    "title": exp.title
-                })
+                stats = skill_timeline[sys.intern(skill.lower())]
+                if stats["count"] == 0:
+                    stats["min_idx"] = i
+                stats["count"] += 1
+                stats["max_idx"] = i
 
         # Find skills that appear across multiple jobs (core skills)
         core_skills = []
         emerging_skills = []
+        last_job_index = len(work_experiences) - 1
 
-        for skill, appearances in skill_timeline.items():
-            if len(appearances) >= 2:
+        for skill, stats in skill_timeline.items():
+            if stats["count"] >= 2:
                 core_skills.append({
                     "skill": skill,
-                    "frequency": len(appearances),
-                    "span": max(app["job_index"] for app in appearances) - min(
-                        app["job_index"] for app in appearances) + 1
+                    "frequency": stats["count"],
+                    "span": stats["max_idx"] - stats["min_idx"] + 1
                 })
-            elif appearances[-1]["job_index"] == len(work_experiences) - 1:  # Appears in most recent job
+            elif stats["max_idx"] == last_job_index:  # Appears in most recent job
                 emerging_skills.append(skill)
 
         return {
-            "total_unique_skills": len(all_skills),
-            "core_skills": sorted(core_skills, key=lambda x: x["frequency"], reverse=True)[:5],
+            "total_unique_skills": len(skill_timeline),
+            "core_skills": heapq.nlargest(5, core_skills, key=itemgetter("frequency")),
             "emerging_skills": emerging_skills[:5],
-            "skill_diversity_score": len(all_skills) / len(work_experiences) if work_experiences else 0
+            "skill_diversity_score": len(skill_timeline) / len(work_experiences) if work_experiences else 0
         }
 
-    def _find_closest_entity(self, target_entity: Dict, candidate_entities: List[Dict], max_distance: int = 100) -> \
-    Optional[Dict]:
+    @staticmethod
+    def _entity_midpoints(entities: List[Dict]) -> np.ndarray:
+        """Midpoint positions of a candidate entity list as one array"""
+        return np.fromiter(((e["start"] + e["end"]) / 2 for e in entities),
+                           dtype=np.float64, count=len(entities))
+
+    def _find_closest_entity(self, target_entity: Dict, candidate_entities: List[Dict],
+                             midpoints: Optional[np.ndarray] = None, max_distance: int = 100,
+                             distances: Optional[np.ndarray] = None) -> Optional[Dict]:
         """Find the closest entity to a target entity"""
         if not candidate_entities:
             return None
 
-        target_pos = (target_entity["start"] + target_entity["end"]) / 2
-
-        closest_entity = None
-        min_distance = float('inf')
+        if distances is None:
+            if midpoints is None:
+                midpoints = self._entity_midpoints(candidate_entities)
+            target_pos = (target_entity["start"] + target_entity["end"]) / 2
+            distances = np.abs(midpoints - target_pos)
 
-        for candidate in candidate_entities:
-            candidate_pos = (candidate["start"] + candidate["end"]) / 2
-            distance = abs(target_pos - candidate_pos)
+        # Vectorized distance + range mask instead of a Python loop per candidate
+        distances = np.where(distances <= max_distance, distances, np.inf)
+        closest = int(np.argmin(distances))
+        return candidate_entities[closest] if np.isfinite(distances[closest]) else None
 
-            if distance < min_distance and distance <= max_distance:
-                min_distance = distance
-                closest_entity = candidate
-
-        return closest_entity
-
-    def _find_nearby_entities(self, target_entity: Dict, candidate_entities: List[Dict], max_distance: int = 200) -> \
-    List[Dict]:
+    def _find_nearby_entities(self, target_entity: Dict, candidate_entities: List[Dict],
+                              midpoints: Optional[np.ndarray] = None, max_distance: int = 200,
+                              distances: Optional[np.ndarray] = None) -> List[Dict]:
         """Find entities near a target entity"""
-        target_pos = (target_entity["start"] + target_entity["end"]) / 2
-        nearby_entities = []
-
-        for candidate in candidate_entities:
-            candidate_pos = (candidate["start"] + candidate["end"]) / 2
-            distance = abs(target_pos - candidate_pos)
+        if not candidate_entities:
+            return []
 
-            if distance <= max_distance:
-                nearby_entities.append(candidate)
+        if distances is None:
+            if midpoints is None:
+                midpoints = self._entity_midpoints(candidate_entities)
+            target_pos = (target_entity["start"] + target_entity["end"]) / 2
+            distances = np.abs(midpoints - target_pos)
 
-        return sorted(nearby_entities, key=lambda x: abs((x["start"] + x["end"]) / 2 - target_pos))
+        within = np.flatnonzero(distances <= max_distance)
+        order = within[np.argsort(distances[within], kind='stable')]
+        return [candidate_entities[i] for i in order]
 
-    def _extract_contextual_skills(self, text: str, start_pos: int, end_pos: int, context_window: int = 300) -> List[
+    def _extract_contextual_skills(self, text: str, start_pos: int, end_pos: int, context_window: int = 300,
+                                   text_lower: Optional[str] = None) -> List[
         str]:
         """Extract skills mentioned near a specific position in text"""
+        if text_lower is None:
+            text_lower = text.lower()
+
         context_start = max(0, start_pos - context_window)
         context_end = min(len(text), end_pos + context_window)
-        context = text[context_start:context_end].lower()
+        context = text_lower[context_start:context_end]
 
+        # One pass through the fused skill alternation covers every known
+        # skill in the window
         found_skills = []
-
-        # Check against known skill categories
-        for category_skills in self.skill_categories.values():
-            for skill in category_skills:
-                if skill in context and skill not in found_skills:
-                    found_skills.append(skill.title())
+        seen = set()
+        for match in self._skill_scan_re.finditer(context):
+            skill = match.group(0)
+            if skill not in seen:
+                seen.add(skill)
+                found_skills.append(self._skill_lookup[skill][1])
 
         return found_skills
 
-    def _extract_year(self, date_string: str) -> Optional[int]:
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _extract_year(date_string: str) -> Optional[int]:
         """Extract year from a date string"""
         if not date_string:
             return None
 
-        year_match = re.search(r'\b(19|20)\d{2}\b', date_string)
+        # Fast path: the overwhelmingly common case is a bare "YYYY" half
+        # of a range, which needs no regex scan at all
+        if len(date_string) == 4 and date_string.isdecimal() and date_string[:2] in ("19", "20"):
+            return int(date_string)
+
+        year_match = DATE_YEAR.search(date_string)
         return int(year_match.group()) if year_match else None
 
-    def _work_exp_to_dict(self, work_exp: WorkExperience) -> Dict:
-        """Convert WorkExperience to dictionary"""
-        return {
-            "title": work_exp.title,
-            "company": work_exp.company,
-            "start_date": work_exp.start_date,
-            "end_date": work_exp.end_date,
-            "duration": work_exp.duration,
-            "skills": work_exp.skills,
-            "achievements": work_exp.achievements,
-            "location": work_exp.location
-        }
 
-    def _education_to_dict(self, education: EducationRecord) -> Dict:
-        """Convert EducationRecord to dictionary"""
-        return {
-            "degree": education.degree,
-            "field": education.field,
-            "school": education.school,
-            "year": education.year,
-            "gpa": education.gpa,
-            "location": education.location
-        }
+@lru_cache(maxsize=64)
+def _keyword_scanner(keywords: Tuple[str, ...]):
+    """Build a one-pass scanner for a JD keyword set, cached per set.
+
+    The zero-width lookahead lets overlapping occurrences match, and the
+    implied map records keywords contained in other keywords, so counting
+    distinct hits is equivalent to one substring check per keyword.
+    """
+    pattern = re.compile("(?=(" + "|".join(
+        re.escape(k) for k in sorted(set(keywords), key=len, reverse=True)) + "))")
+    implied = {
+        kw: frozenset(other for other in keywords if other != kw and other in kw)
+        for kw in keywords
+    }
+    return pattern, implied
 
 
-def _infer_context_for_ats(text: str, structured_data: Dict) -> Dict:
+def _infer_context_for_ats(text: str, structured_data: Dict,
+                           text_lower: Optional[str] = None) -> Dict:
     """Build minimal context_results from text and structured_data when not provided."""
-    text_lower = text.lower()
+    if text_lower is None:
+        text_lower = text.lower()
     entities = []
     personal = structured_data.get("personal_info") or {}
     if isinstance(personal, dict):
@@ -524,7 +756,7 @@ def _infer_context_for_ats(text: str, structured_data: Dict) -> Dict:
             entities.append({"label": "PHONE", "text": str(personal["phone"])})
         if personal.get("name"):
             entities.append({"label": "NAME", "text": str(personal["name"])})
-    if not entities and re.search(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b", text):
+    if not entities and EMAIL_RE.search(text):
         entities.append({"label": "EMAIL", "text": "found"})
     section_analysis = {
         "has_experience": "experience" in text_lower or "employment" in text_lower,
@@ -538,7 +770,7 @@ def _infer_context_for_ats(text: str, structured_data: Dict) -> Dict:
 def _extract_year_from_date(date_str: Optional[str]) -> Optional[int]:
     if not date_str:
         return None
-    m = re.search(r"\b(19|20)\d{2}\b", str(date_str))
+    m = DATE_YEAR.search(str(date_str))
     return int(m.group()) if m else None
 
 
@@ -547,6 +779,7 @@ def _run_ats_engine(
     context_results: Dict,
     structured_data: Dict,
     jd_keywords: Optional[List[str]] = None,
+    text_lower: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Core ATS scoring: returns score (0-100), breakdown dict, and issues list.
@@ -554,7 +787,8 @@ def _run_ats_engine(
     """
     breakdown = {}
     issues: List[str] = []
-    text_lower = text.lower()
+    if text_lower is None:
+        text_lower = text.lower()
     entities = context_results.get("entities") or []
     section_analysis = context_results.get("section_analysis") or {}
 
@@ -581,9 +815,17 @@ def _run_ats_engine(
             "skills": 5,
         }
 
-    has_email = any(e.get("label") == "EMAIL" and "@" in str(e.get("text", "")) for e in entities)
-    has_phone = any(e.get("label") == "PHONE" for e in entities)
-    has_name = any(e.get("label") in ("NAME", "PERSON") for e in entities)
+    # Single pass over the entities; the email check also needs the text,
+    # so a plain label set is not enough here
+    has_email = has_phone = has_name = False
+    for e in entities:
+        label = e.get("label")
+        if label == "EMAIL" and "@" in str(e.get("text", "")):
+            has_email = True
+        elif label == "PHONE":
+            has_phone = True
+        elif label in ("NAME", "PERSON"):
+            has_name = True
     contact_pts = (40 if has_email else 0) + (30 if has_phone else 0) + (30 if has_name else 0)
     breakdown["contact"] = min(100, contact_pts)
     if not has_email:
@@ -593,32 +835,44 @@ def _run_ats_engine(
     if not has_name:
         issues.append("Name or contact block unclear")
 
+    # First occurrence of every section anchor in one scan; the individual
+    # "word in text_lower" / str.find calls below all read from this map
+    anchor_pos = {}
+    for m in SECTION_ANCHOR_RE.finditer(text_lower):
+        word = m.group(0)
+        if word not in anchor_pos:
+            anchor_pos[word] = m.start()
+            if len(anchor_pos) == 5:
+                break
+
     standard_sections = ["experience", "education", "skills", "summary"]
-    found_sections = sum(1 for s in standard_sections if s in text_lower)
+    found_sections = sum(1 for s in standard_sections if s in anchor_pos)
     breakdown["sections"] = min(100, int((found_sections / 4) * 100))
-    if "summary" not in text_lower and "objective" not in text_lower:
+    if "summary" not in anchor_pos and "objective" not in anchor_pos:
         issues.append("Summary section missing")
 
-    header_lines = [ln.strip() for ln in text.split("\n") if 5 <= len(ln.strip()) <= 60]
+    header_lines = [ln.strip() for ln in text.splitlines() if 5 <= len(ln.strip()) <= 60]
     for line in header_lines:
         line_lower = line.lower()
-        if any(re.search(p, line_lower) for p in STANDARD_SECTION_HEADERS):
+        if STANDARD_SECTION_HEADER_RE.search(line_lower):
             continue
         if line_lower.replace(" ", "").isalpha() or (len(line) < 40 and line[0].isupper()):
-            if any(h in line_lower for h in NON_STANDARD_HEADER_HINTS):
+            if NONSTD_HINT_RE.search(line_lower):
                 issues.append(f"Non-standard section header: \"{line[:50]}\"")
                 break
 
     has_years = bool(DATE_YEAR.search(text))
     month_year = bool(DATE_MONTH_YEAR.search(text_lower))
-    date_formats_consistent = has_years and (month_year or re.search(r"\b\d{1,2}/\d{4}\b|\b\d{4}\b", text))
+    date_formats_consistent = has_years and (month_year or SLASH_OR_YEAR_RE.search(text))
     breakdown["dates"] = 100 if (has_years and month_year) else (80 if has_years else 0)
     if has_years and not date_formats_consistent:
         issues.append("Date format inconsistent; use Month YYYY or YYYY consistently")
 
-    special_count = len(re.findall(r"[^\w\s\-.,()@\n]", text))
+    # Count via finditer so no match lists are materialized; the blank-line
+    # check stops as soon as a fourth run is seen
+    special_count = sum(1 for _ in SPECIAL_CHAR_RE.finditer(text))
     excess_special = special_count > len(text) * 0.02
-    excess_newlines = len(re.findall(r"\n\s*\n\s*\n", text)) > 3
+    excess_newlines = sum(1 for _ in islice(BLANK_LINES_RE.finditer(text), 4)) > 3
     formatting_penalty = (15 if excess_special else 0) + (15 if excess_newlines else 0)
     breakdown["formatting"] = max(0, 100 - formatting_penalty)
     if excess_special:
@@ -644,11 +898,11 @@ def _run_ats_engine(
         breakdown["education"] = min(100, int((with_school / len(education)) * 100))
 
     skills_dict = structured_data.get("skills") or {}
-    total_skills = sum(len(slist) for slist in skills_dict.values() if isinstance(slist, list))
+    total_skills = sum(map(len, (slist for slist in skills_dict.values() if isinstance(slist, list))))
     breakdown["skills"] = min(100, total_skills * 5) if total_skills else 0
 
-    exp_pos = text_lower.find("experience") if "experience" in text_lower else len(text) + 1
-    edu_pos = text_lower.find("education") if "education" in text_lower else len(text) + 1
+    exp_pos = anchor_pos.get("experience", len(text) + 1)
+    edu_pos = anchor_pos.get("education", len(text) + 1)
     work_before_edu = exp_pos <= edu_pos or not work_exp
     if "section_order" in weights:
         breakdown["section_order"] = 100 if work_before_edu else 50
@@ -662,15 +916,21 @@ def _run_ats_engine(
             job_start_years.append(y)
     reverse_chron = True
     if len(job_start_years) >= 2:
-        reverse_chron = job_start_years == sorted(job_start_years, reverse=True)
+        # Pairwise check instead of building a sorted copy to compare
+        reverse_chron = all(a >= b for a, b in zip(job_start_years, job_start_years[1:]))
     if not reverse_chron and len(job_start_years) >= 2:
         issues.append("Dates should be reverse chronological (most recent first)")
 
     if jd_keywords:
-        keywords_lower = [k.lower().strip() for k in jd_keywords if k and isinstance(k, str)]
+        # Dedupe after lowercasing: callers build jd_keywords via set(), but
+        # case variants like "Python"/"python" survive that and would
+        # collide here, deflating the distinct-hit counts against a
+        # max_possible that still counted both copies
+        keywords_lower = list(dict.fromkeys(
+            k.lower().strip() for k in jd_keywords if k and isinstance(k, str)))
         if keywords_lower:
-            idxs = [text_lower.find(w) for w in ("experience", "education", "skills")]
-            summary_end = min(400, *(i if i >= 0 else len(text_lower) for i in idxs), len(text_lower))
+            summary_end = min(400, *(anchor_pos.get(w, len(text_lower))
+                                     for w in ("experience", "education", "skills")), len(text_lower))
             summary_zone = text_lower[:summary_end]
             titles_zone = " ".join([str(e.get("title") or "") for e in work_exp]).lower()
             skills_text = " ".join(
@@ -678,8 +938,14 @@ def _run_ats_engine(
                 for slist in skills_dict.values() for s in (slist if isinstance(slist, list) else [])
             )
             body_zone = text_lower
+            # One fused scan per zone instead of one substring search per
+            # keyword per zone
+            kw_pattern, kw_implied = _keyword_scanner(tuple(keywords_lower))
             def count_in_zone(zone: str) -> int:
-                return sum(1 for kw in keywords_lower if kw in zone)
+                seen = {m.group(1) for m in kw_pattern.finditer(zone)}
+                for kw in tuple(seen):
+                    seen |= kw_implied[kw]
+                return len(seen)
             summary_hits = count_in_zone(summary_zone)
             title_hits = count_in_zone(titles_zone)
             body_hits = count_in_zone(body_zone)
@@ -712,9 +978,33 @@ def calculate_ats_score(
     for before/after scoring (ats_score_original, ats_score_enhanced).
     Returns dict with score (0-100), breakdown, and issues.
     """
-    if context_results is None:
-        context_results = _infer_context_for_ats(resume_text, structured_data)
-    return _run_ats_engine(resume_text, context_results, structured_data, jd_keywords=jd_keywords)
+    if context_results is not None:
+        # Caller-supplied context can hold unhashable state (e.g. a Doc),
+        # so only the inferred path below is memoized
+        return _run_ats_engine(resume_text, context_results, structured_data, jd_keywords=jd_keywords)
+
+    # Before/after enhance flows score the same inputs repeatedly; key on
+    # content digests plus the keyword list
+    key = (
+        blake2b(resume_text.encode('utf-8'), digest_size=16).digest(),
+        blake2b(repr(structured_data).encode('utf-8'), digest_size=16).digest(),
+        tuple(jd_keywords or ()),
+    )
+    cached = _ATS_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    # One lowercase pass shared by context inference and the scoring engine
+    text_lower = resume_text.lower()
+    context_results = _infer_context_for_ats(resume_text, structured_data, text_lower=text_lower)
+    result = _run_ats_engine(resume_text, context_results, structured_data,
+                             jd_keywords=jd_keywords, text_lower=text_lower)
+
+    if len(_ATS_CACHE) >= _ATS_CACHE_SIZE:
+        # Drop the oldest entry (dicts preserve insertion order)
+        _ATS_CACHE.pop(next(iter(_ATS_CACHE)))
+    _ATS_CACHE[key] = result
+    return result
 
 
 class ResumeIntelligenceAnalyzer:
@@ -723,32 +1013,52 @@ class ResumeIntelligenceAnalyzer:
     for comprehensive resume intelligence
     """
 
+    _ANALYSIS_CACHE_SIZE = 64
+
     def __init__(self, nlp_model):
         self.nlp = nlp_model
         self.context_extractor = None  # Will be set from section detector
         self.relationship_extractor = IntelligentRelationshipExtractor(nlp_model)
+        self._analysis_cache = {}
 
-    def analyze_resume(self, text: str) -> Dict:
+    def analyze_resume(self, text: str, doc=None) -> Dict:
         """
         Perform comprehensive resume analysis combining all intelligence layers
+
+        A pre-parsed Doc (e.g. from nlp.pipe in analyze_resumes) is reused
+        instead of parsing the text again. Results are cached on a content
+        hash so re-analyzing identical text skips the pipeline entirely.
         """
         # Import here to avoid circular imports
         from intelligent_section_detector import ContextAwareEntityExtractor
 
+        cache_key = blake2b(text.encode('utf-8'), digest_size=16).digest()
+        cached = self._analysis_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         if not self.context_extractor:
             self.context_extractor = ContextAwareEntityExtractor(self.nlp)
 
-        # Layer 1: Context-aware entity extraction
-        context_results = self.context_extractor.extract_with_context(text)
+        # Layer 1: Context-aware entity extraction. This is deliberately one
+        # full-pipeline pass over the whole resume: the education and skills
+        # extractors consume NER labels (DEGREE, SKILL, ...) from those
+        # sections too, so routing them through the bare tokenizer would
+        # drop the entities they depend on.
+        context_results = self.context_extractor.extract_entities_with_context(text)
         entities = context_results["entities"]
 
-        # Layer 2: Relationship extraction
-        relationship_results = self.relationship_extractor.extract_relationships(text, entities)
+        # Layer 2: Relationship extraction, reusing whichever Doc already
+        # exists (caller-supplied or the one layer 1 parsed) so the text is
+        # run through the pipeline exactly once
+        if doc is None:
+            doc = context_results.get("doc")
+        relationship_results = self.relationship_extractor.extract_relationships(text, entities, doc=doc)
 
         # Layer 3: Advanced analytics
         analytics = self._perform_advanced_analytics(context_results, relationship_results, text)
 
-        return {
+        results = {
             "entities": entities,
             "sections": context_results["sections"],
             "section_analysis": context_results["section_analysis"],
@@ -762,6 +1072,29 @@ class ResumeIntelligenceAnalyzer:
             "resume_analytics": analytics
         }
 
+        if len(self._analysis_cache) >= self._ANALYSIS_CACHE_SIZE:
+            # Drop the oldest entry (dicts preserve insertion order)
+            self._analysis_cache.pop(next(iter(self._analysis_cache)))
+        self._analysis_cache[cache_key] = results
+        return results
+
+    def analyze_resumes(self, texts: Iterable[str], n_process: Optional[int] = None,
+                        batch_size: int = 25) -> Iterator[Dict]:
+        """
+        Analyze many resumes, parsing them through nlp.pipe so tokenization
+        and NER run batched and across worker processes instead of one
+        pipeline invocation per document.
+
+        n_process defaults to half the machine's cores, leaving headroom
+        for the Python post-processing; pass 1 to stay single-process.
+        """
+        if n_process is None:
+            n_process = max(1, (os.cpu_count() or 2) // 2)
+        texts = list(texts)
+        docs = self.nlp.pipe(texts, n_process=n_process, batch_size=batch_size)
+        for text, doc in zip(texts, docs):
+            yield self.analyze_resume(text, doc=doc)
+
     def _perform_advanced_analytics(self, context_results: Dict, relationship_results: Dict, text: str) -> Dict:
         """Perform advanced resume analytics"""
 
@@ -800,10 +1133,12 @@ class ResumeIntelligenceAnalyzer:
         if context_results["section_analysis"]["has_skills"]:
             score += 10
 
-        # Contact information (20 points)
-        has_email = any(e["label"] == "EMAIL" for e in context_results["entities"])
-        has_phone = any(e["label"] == "PHONE" for e in context_results["entities"])
-        has_name = any(e["label"] in ["NAME", "PERSON"] for e in context_results["entities"])
+        # Contact information (20 points) - one pass over the labels
+        # instead of one any() scan per contact field
+        label_set = {e["label"] for e in context_results["entities"]}
+        has_email = "EMAIL" in label_set
+        has_phone = "PHONE" in label_set
+        has_name = "NAME" in label_set or "PERSON" in label_set
 
         score += 8 if has_email else 0
         score += 6 if has_phone else 0
@@ -840,15 +1175,15 @@ class ResumeIntelligenceAnalyzer:
 
     def _analyze_skills_depth(self, skills_dict: Dict) -> Dict:
         """Analyze the depth and breadth of skills"""
-        total_skills = sum(len(skill_list) for skill_list in skills_dict.values())
         categories = len(skills_dict)
 
-        # Find skills with proficiency levels
+        # Count totals and proficiency-tagged skills in one traversal
+        total_skills = 0
         skills_with_proficiency = 0
         for skill_list in skills_dict.values():
-            for skill in skill_list:
-                if skill.get("proficiency"):
-                    skills_with_proficiency += 1
+            total_skills += len(skill_list)
+            skills_with_proficiency += sum(1 for skill in skill_list
+                                           if skill.get("proficiency"))
 
         return {
             "total_skills": total_skills,
@@ -874,22 +1209,31 @@ class ResumeIntelligenceAnalyzer:
 
             if len(years) > 1:
                 years.sort()
-                for i in range(len(years) - 1):
-                    if years[i + 1] - years[i] > 2:  # Gap > 2 years
-                        red_flags.append("Potential employment gap detected")
-                        break
+                max_gap = max((b - a for a, b in zip(years, years[1:])), default=0)
+                if max_gap > 2:  # Gap > 2 years
+                    red_flags.append("Potential employment gap detected")
 
         # Very short tenure pattern
         experience_metrics = relationship_results["experience_metrics"]
         if experience_metrics["average_tenure"] < 1 and experience_metrics["companies"] > 2:
             red_flags.append("Pattern of short job tenure")
 
-        # Missing contact information
-        if not any("@" in text for line in text.split("\n")[:5]):  # No email in first 5 lines
+        # Missing contact information - no email in first 5 lines
+        # (walk newlines instead of splitting the whole document; the old
+        # check also tested `text` rather than each line, so it only fired
+        # when the entire resume had no @ at all)
+        head_end = 0
+        for _ in range(5):
+            newline = text.find("\n", head_end)
+            if newline == -1:
+                head_end = len(text)
+                break
+            head_end = newline + 1
+        if "@" not in text[:head_end]:
             red_flags.append("Contact information may be unclear")
 
         # Inconsistent formatting
-        if len(re.findall(r'\n\s*\n\s*\n', text)) > 3:  # Too many blank lines
+        if len(BLANK_LINES_RE.findall(text)) > 3:  # Too many blank lines
             red_flags.append("Inconsistent formatting detected")
 
         return red_flags
@@ -915,7 +1259,7 @@ class ResumeIntelligenceAnalyzer:
 
         # Quantified achievements
         achievements = relationship_results["achievements"]
-        if any(re.search(r'\d+[%$]|\d+\s*(?:years?|months?)', ach) for ach in achievements):
+        if any(QUANTIFIED_ACHIEVEMENT_RE.search(ach) for ach in achievements):
             strengths.append("Quantified achievements")
 
         # Strong section organization
@@ -939,15 +1283,23 @@ class ResumeIntelligenceAnalyzer:
         return max(0, min(100, int(base_score + bonus - red_flag_penalty)))
 
 
+@lru_cache(maxsize=4)
+def _load_nlp(name: str, exclude: Tuple[str, ...] = ()):
+    """Load a spaCy pipeline once per (name, exclude) and reuse it across
+    analyzer instances in the same process."""
+    return spacy.load(name, exclude=list(exclude))
+
+
 # Usage example
 def test_intelligent_resume_analysis():
     """Test the complete intelligent resume analysis"""
-    import spacy
-
+    # Only tok2vec + ner are consumed by the analyzer, so skip loading the
+    # tagger/parser/lemmatizer weights entirely
+    exclude = ("tagger", "parser", "lemmatizer", "attribute_ruler")
     try:
-        nlp = spacy.load("output_hybrid")
+        nlp = _load_nlp("output_hybrid", exclude)
     except:
-        nlp = nlp = spacy.load("en_core_web_lg")
+        nlp = _load_nlp("en_core_web_lg", exclude)
 
     analyzer = ResumeIntelligenceAnalyzer(nlp)
 
@@ -991,54 +1343,64 @@ def test_intelligent_resume_analysis():
 
     results = analyzer.analyze_resume(test_resume)
 
-    print(" INTELLIGENT RESUME ANALYSIS")
-    print("=" * 50)
-
-    print(f"\n OVERALL SCORES:")
+    # Build the report in memory and emit it with a single write instead
+    # of one stdio call per line; each result collection is looked up once
     analytics = results["resume_analytics"]
-    print(f"   Overall Quality: {analytics['overall_quality_score']}/100")
-    print(f"   Completeness: {analytics['completeness_score']}/100")
-    print(f"   ATS Compatibility: {analytics['ats_compatibility_score']}/100")
-
-    print(f"\ WORK EXPERIENCE ({len(results['work_experience'])} jobs):")
-    for exp in results["work_experience"]:
-        print(f"   • {exp['title']} at {exp['company']} ({exp['start_date']}-{exp['end_date']})")
-        if exp["skills"]:
-            print(f"     Skills: {', '.join(exp['skills'][:3])}{'...' if len(exp['skills']) > 3 else ''}")
-
-    print(f"\ EDUCATION:")
-    for edu in results["education"]:
-        print(f"   • {edu['degree']} from {edu['school']} ({edu['year']})")
+    work_experience = results["work_experience"]
+    education = results["education"]
+    skills_map = results["skills"]
+    achievements = results["achievements"]
+    exp_metrics = results["experience_metrics"]
+    career_prog = results["career_progression"]
+    red_flags = analytics["red_flags"]
+
+    lines = [
+        " INTELLIGENT RESUME ANALYSIS",
+        "=" * 50,
+        "\n OVERALL SCORES:",
+        f"   Overall Quality: {analytics['overall_quality_score']}/100",
+        f"   Completeness: {analytics['completeness_score']}/100",
+        f"   ATS Compatibility: {analytics['ats_compatibility_score']}/100",
+        f"\ WORK EXPERIENCE ({len(work_experience)} jobs):",
+    ]
+    for exp in work_experience:
+        lines.append(f"   • {exp['title']} at {exp['company']} ({exp['start_date']}-{exp['end_date']})")
+        top_skills = exp["skills"][:3]
+        if top_skills:
+            more = '...' if len(exp["skills"]) > 3 else ''
+            lines.append(f"     Skills: {', '.join(top_skills)}{more}")
+
+    lines.append("\ EDUCATION:")
+    for edu in education:
+        lines.append(f"   • {edu['degree']} from {edu['school']} ({edu['year']})")
         if edu["gpa"]:
-            print(f"     GPA: {edu['gpa']}")
+            lines.append(f"     GPA: {edu['gpa']}")
 
-    print(f"\n SKILLS BY CATEGORY:")
-    for category, skills in results["skills"].items():
-        print(f"   {category}: {len(skills)} skills")
+    lines.append("\n SKILLS BY CATEGORY:")
+    for category, skills in skills_map.items():
+        lines.append(f"   {category}: {len(skills)} skills")
         for skill in skills[:3]:  # Show first 3
             proficiency = f" ({skill['proficiency']})" if skill.get('proficiency') else ""
-            print(f"     • {skill['name']}{proficiency}")
-
-    print(f"\n CAREER INSIGHTS:")
-    exp_metrics = results["experience_metrics"]
-    career_prog = results["career_progression"]
-    print(f"   • Total Experience: {exp_metrics['total_years']} years")
-    print(f"   • Companies: {exp_metrics['companies']}")
-    print(f"   • Career Trend: {career_prog['trend']}")
-    print(f"   • Progression Score: {career_prog['progression_score']}/10")
-
-    print(f"\n STRENGTHS:")
-    for strength in analytics["strengths"]:
-        print(f"   • {strength}")
-
-    if analytics["red_flags"]:
-        print(f"\n AREAS FOR IMPROVEMENT:")
-        for flag in analytics["red_flags"]:
-            print(f"   • {flag}")
-
-    print(f"\n ACHIEVEMENTS:")
-    for achievement in results["achievements"][:3]:
-        print(f"   • {achievement}")
+            lines.append(f"     • {skill['name']}{proficiency}")
+
+    lines += [
+        "\n CAREER INSIGHTS:",
+        f"   • Total Experience: {exp_metrics['total_years']} years",
+        f"   • Companies: {exp_metrics['companies']}",
+        f"   • Career Trend: {career_prog['trend']}",
+        f"   • Progression Score: {career_prog['progression_score']}/10",
+        "\n STRENGTHS:",
+    ]
+    lines.extend(f"   • {strength}" for strength in analytics["strengths"])
+
+    if red_flags:
+        lines.append("\n AREAS FOR IMPROVEMENT:")
+        lines.extend(f"   • {flag}" for flag in red_flags)
+
+    lines.append("\n ACHIEVEMENTS:")
+    lines.extend(f"   • {achievement}" for achievement in achievements[:3])
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
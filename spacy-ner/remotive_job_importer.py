@@ -2,6 +2,7 @@ import requests
 import logging
 from datetime import datetime
 from database import db
+from embedding_service import ResumeJobEmbeddingService
 from typing import Dict, List
 import numpy as np
 
@@ -16,6 +17,15 @@ class RemotiveJobImporter:
     def __init__(self):
         """Initializes the importer and statistics."""
         self.api_url = "https://remotive.com/api/remote-jobs"
+
+        # Initialize embedding service for job processing
+        try:
+            self.embedding_service = ResumeJobEmbeddingService()
+            logger.info(" Embedding service ready for Remotive jobs")
+        except Exception as e:
+            logger.error(f" Embedding service failed: {e}")
+            self.embedding_service = None
+
         self.stats = {
             'total_fetched': 0,
             'successfully_imported': 0,
@@ -31,6 +41,10 @@ class RemotiveJobImporter:
         """
         Fetches jobs from the Remotive API and stores them in the database.
 
+        Jobs are normalized and de-duplicated first, then all field
+        embeddings are generated in one batched encode before storing, so
+        the transformer runs once per import instead of once per job.
+
         Args:
             limit (int): The maximum number of jobs to fetch, per API documentation.
         """
@@ -52,6 +66,8 @@ class RemotiveJobImporter:
             self.stats['total_fetched'] = len(jobs_from_api)
             logger.info(f"Found {self.stats['total_fetched']} jobs from API.")
 
+            # Phase 1: normalize and de-duplicate before any model work
+            pending = []
             for job_data in jobs_from_api:
                 try:
                     title = job_data.get('title', '').strip()
@@ -70,12 +86,26 @@ class RemotiveJobImporter:
                         self.stats['duplicates_skipped'] += 1
                         continue
 
-                    job_dict = self._prepare_job_data(job_data)
+                    pending.append(self._prepare_job_data(job_data))
 
+                except Exception as e:
+                    self.stats['failed_imports'] += 1
+                    logger.error(f"Failed to process job '{job_data.get('title')}': {e}")
+
+            # Phase 2: one batched encode for every field of every new job
+            if pending and self.embedding_service:
+                description_embeddings, title_embeddings, requirements_embeddings = \
+                    self.embedding_service.generate_job_field_embeddings_batch(pending)
+            else:
+                zeros = [np.zeros(384) for _ in pending]
+                description_embeddings = title_embeddings = requirements_embeddings = zeros
+
+            for i, job_dict in enumerate(pending):
+                try:
                     embeddings = {
-                        'description': np.zeros(384),
-                        'title': np.zeros(384),
-                        'requirements': np.zeros(384)
+                        'description': np.asarray(description_embeddings[i]).astype(np.float16),
+                        'title': np.asarray(title_embeddings[i]).astype(np.float16),
+                        'requirements': np.asarray(requirements_embeddings[i]).astype(np.float16)
                     }
 
                     db.store_job_posting(job_dict, embeddings)
@@ -83,7 +113,7 @@ class RemotiveJobImporter:
 
                 except Exception as e:
                     self.stats['failed_imports'] += 1
-                    logger.error(f"Failed to process job '{job_data.get('title')}': {e}")
+                    logger.error(f"Failed to store job '{job_dict.get('title')}': {e}")
 
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to fetch data from Remotive API: {e}")
@@ -126,4 +156,4 @@ class RemotiveJobImporter:
             'job_url': job_data.get('url', ''),
             'posted_date': posted_date,
             'skills_required': skills
-        }
\ No newline at end of file
+        }